@@ -11,27 +11,135 @@ Date: Dec 2024
 """
 
 import imaplib
-import email
+import concurrent.futures
+import functools
+import heapq
+import random
 import time
 import threading
 import configparser
+import io
+import json
 import os
-from datetime import datetime
+import shutil
+import select
+import socket
+import ssl
+from email import policy as email_policy
 from email.header import decode_header
+from email.message import EmailMessage
+from email.parser import BytesHeaderParser
+from email.utils import parseaddr
+from html.parser import HTMLParser
 import logging
 import signal
-import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 # Optional imports for notification services
 from twilio.rest import Client  # For SMS, Voice Call, WhatsApp
+from twilio.http.http_client import TwilioHttpClient
+from twilio.twiml.voice_response import VoiceResponse
 from slack_sdk import WebClient  # For Slack notifications
 from slack_sdk.errors import SlackApiError
 import requests  # For Telegram, Discord, and Custom Webhooks
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster JSON encoding of webhook payloads
+except ImportError:
+    orjson = None
+
+# Module logger; handlers are attached to the root logger by setup_logging()
+log = logging.getLogger(__name__)
 
 # Set the path for the configuration and log files
 CONFIG_FILE_PATH = 'config.ini'
 LOG_FILE_PATH = 'email_monitor.log'
 
+# Parsed configuration files keyed by (path, st_mtime_ns) so unchanged files are not re-read
+_CONFIG_CACHE = {}
+
+# IMAP IDLE settings (RFC 2177): re-issue IDLE before the server's 30-minute inactivity timeout
+IDLE_TAG = b'E2NB'
+IDLE_TIMEOUT = 28 * 60
+# Keep-alive interval for servers that do not advertise IDLE
+NOOP_INTERVAL = 28
+# Seconds a blocking IMAP read may stall before the connection is treated as lost, which
+# also bounds how long a shutdown can be held up by an unresponsive server
+IMAP_TIMEOUT = 30
+
+# Maximum number of unread emails processed per check, most recent first
+MAX_EMAILS_PER_CHECK = 5
+
+# Maximum number of bytes of the plain text body fetched per email
+BODY_FETCH_LIMIT = 65536
+# Bytes fetched per character of an SMS-only notification; covers multi-byte UTF-8 text
+# in base64 transfer encoding
+SMS_FETCH_BYTES_PER_CHAR = 6
+
+# Worker threads used to send the notifications for an email concurrently, and the
+# number of seconds to wait for them before moving on
+NOTIFICATION_WORKERS = 8
+NOTIFICATION_TIMEOUT = 60
+
+# Upper bound in seconds for the growing delay between failed IMAP connection attempts
+RECONNECT_MAX_DELAY = 5 * 60
+
+# Twilio clients keyed by (account_sid, auth_token), reused so their HTTP connections stay alive
+_TWILIO_CLIENTS = {}
+_TWILIO_CLIENTS_LOCK = threading.Lock()
+
+# Slack clients keyed by token, reused for the same reason
+_SLACK_CLIENTS = {}
+_SLACK_CLIENTS_LOCK = threading.Lock()
+
+# (connect, read) timeouts in seconds for notification HTTP requests, so a stalled
+# endpoint cannot block the monitor indefinitely
+HTTP_TIMEOUT = (5, 10)
+
+# Shared HTTP session for Telegram, Discord and custom webhooks (keep-alive connection pooling).
+# Transient failures are retried briefly; the final response is returned rather than raised
+# so its status code gets logged.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.headers.update({'User-Agent': 'e2nb/0.1'})
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+))
+
+# Translation tables that backslash-escape the characters with a special meaning in
+# Telegram MarkdownV2 and Discord markdown, so subjects and bodies are sent verbatim
+_TELEGRAM_ESCAPE = str.maketrans({char: '\\' + char for char in '\\_*[]()~`>#+-=|{}.!'})
+_DISCORD_ESCAPE = str.maketrans({char: '\\' + char for char in '\\*_~`|>'})
+
+# The Discord payload always has the same shape, so only the content string is encoded per message
+_DISCORD_TEMPLATE = b'{"content": %s}'
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def encode_json(value):
+    """
+    Serialize a value to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        value: The JSON-serializable value.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
 
 def load_config(config_file=CONFIG_FILE_PATH):
     """
@@ -43,14 +151,48 @@ def load_config(config_file=CONFIG_FILE_PATH):
     Returns:
         configparser.ConfigParser: An instance containing the loaded configuration data.
     """
-    config = configparser.ConfigParser()
     if not os.path.exists(config_file):
         # If the config file does not exist, create one with default values
         create_default_config(config_file)
-    config.read(config_file)
+
+    # Reuse the parsed file as long as it has not been modified on disk
+    key = (config_file, os.stat(config_file).st_mtime_ns)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        config = configparser.ConfigParser()
+        config.read(config_file)
+        for stale_key in [k for k in _CONFIG_CACHE if k[0] == config_file]:
+            del _CONFIG_CACHE[stale_key]
+        _CONFIG_CACHE[key] = config
     return config
 
 
+def find_config_problem(config):
+    """
+    Check the settings the monitoring loop cannot run without.
+
+    Args:
+        config (configparser.ConfigParser): Configuration data loaded from config.ini.
+
+    Returns:
+        str: A description of the first problem found, or None if the configuration is usable.
+    """
+    # Validate required Email settings
+    email_section = config['Email'] if config.has_section('Email') else {}
+    if not all([email_section.get('imap_server'), email_section.get('imap_port'),
+                email_section.get('username'), email_section.get('password')]):
+        return "Incomplete Email configuration. Please ensure all fields are filled in config.ini."
+
+    # Validate Check Interval; zero or less would make the loop poll the server non-stop
+    try:
+        check_interval = int(config.get('Settings', 'check_interval', fallback='60'))
+        if check_interval <= 0:
+            raise ValueError
+    except ValueError:
+        return "Invalid check_interval in config.ini. It must be a positive integer."
+    return None
+
+
 def save_config(config, config_file=CONFIG_FILE_PATH):
     """
     Save configuration variables to a specified INI configuration file.
@@ -58,9 +200,30 @@ def save_config(config, config_file=CONFIG_FILE_PATH):
     Args:
         config (configparser.ConfigParser): The configuration data to save.
         config_file (str): The path to the configuration INI file.
+
+    The file is only rewritten when its content changes, and it is replaced atomically so
+    an interrupted save never leaves a truncated config.ini behind.
     """
-    with open(config_file, 'w') as file:
-        config.write(file)
+    buffer = io.StringIO()
+    config.write(buffer)
+    data = buffer.getvalue()
+    try:
+        with open(config_file) as file:
+            if file.read() == data:
+                return
+    except OSError:
+        pass
+
+    temp_file = f"{config_file}.tmp"
+    with open(temp_file, 'w') as file:
+        file.write(data)
+        # Make sure the data is on disk before the rename makes it the live config
+        file.flush()
+        os.fsync(file.fileno())
+    # Keep the permissions of the existing file, which may hold credentials
+    if os.path.exists(config_file):
+        shutil.copymode(config_file, temp_file)
+    os.replace(temp_file, config_file)
 
 
 def create_default_config(config_file=CONFIG_FILE_PATH):
@@ -163,6 +326,41 @@ def setup_logging(log_file=LOG_FILE_PATH):
     logger.addHandler(ch)
 
 
+def apply_process_settings(config):
+    """
+    Apply the optional CPU affinity and priority settings to the current process.
+
+    Must run before any threads are started, since Linux applies both settings per
+    thread and new threads inherit them from their creator.
+
+    Args:
+        config (configparser.ConfigParser): Configuration data loaded from config.ini.
+    """
+    settings_section = config['Settings']
+
+    cpu_affinity = settings_section.get('cpu_affinity', '').strip()
+    if cpu_affinity:
+        if hasattr(os, 'sched_setaffinity'):
+            try:
+                cpus = {int(cpu) for cpu in cpu_affinity.split(',') if cpu.strip()}
+                os.sched_setaffinity(0, cpus)
+                log.info("Pinned process to CPU(s) %s.", ', '.join(map(str, sorted(cpus))))
+            except (ValueError, OSError) as e:
+                log.warning("Invalid cpu_affinity in config.ini: %s", e)
+        else:
+            log.warning("cpu_affinity is not supported on this platform.")
+
+    nice = settings_section.get('nice', '0').strip()
+    if nice and nice != '0':
+        if hasattr(os, 'nice'):
+            try:
+                log.info("Process niceness set to %s.", os.nice(int(nice)))
+            except (ValueError, OSError) as e:
+                log.warning("Invalid nice in config.ini: %s", e)
+        else:
+            log.warning("nice is not supported on this platform.")
+
+
 def connect_to_imap(server, port, username, password):
     """
     Establish a secure connection to the specified IMAP server and authenticate using provided credentials.
@@ -177,12 +375,16 @@ def connect_to_imap(server, port, username, password):
         imaplib.IMAP4_SSL: An authenticated IMAP connection object.
     """
     try:
-        imap = imaplib.IMAP4_SSL(server, port)
+        imap = imaplib.IMAP4_SSL(server, port, timeout=IMAP_TIMEOUT)
         imap.login(username, password)
-        logging.info(f"Connected to IMAP server {server}:{port} as {username}.")
+        # Servers often advertise extensions such as IDLE only after authentication
+        typ, data = imap.capability()
+        if typ == 'OK':
+            imap.capabilities = tuple(data[-1].upper().decode().split())
+        log.info("Connected to IMAP server %s:%s as %s.", server, port, username)
         return imap
     except Exception as e:
-        logging.error(f"Failed to connect to IMAP server {server}:{port}: {e}")
+        log.error("Failed to connect to IMAP server %s:%s: %s", server, port, e)
         return None
 
 
@@ -191,95 +393,670 @@ def fetch_unread_emails(imap):
     Retrieve unread emails from the inbox.
 
     Args:
-        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection object.
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with the inbox selected.
+
+    Only the From/Subject headers and the MIME structure are downloaded; use
+    fetch_email_bodies() to download the bodies of the emails that are processed.
 
     Returns:
-        list: A list of tuples containing email IDs and email message objects.
+        list: A list of (email UID, header message object, text part) tuples, where the
+        text part is the (section, encoding, charset, subtype) of the first plain text part,
+        or of the first HTML part if there is no plain text part, or None.
     """
     try:
-        imap.select("inbox")  # Select the inbox folder
-        status, messages = imap.search(None, 'UNSEEN')  # Search for unread messages
-        if status != "OK":
-            logging.warning("No unread emails found.")
-            return []
+        # Work with UIDs so the IDs stay valid even if messages are expunged meanwhile
+        if 'SORT' in imap.capabilities:
+            # Let the server order the unread messages, most recent first (RFC 5256)
+            status, messages = imap.uid('SORT', '(REVERSE ARRIVAL)', 'UTF-8', 'UNSEEN')
+            email_ids = messages[0].split()[:MAX_EMAILS_PER_CHECK] if status == "OK" and messages[0] else []
+        elif 'ESEARCH' in imap.capabilities:
+            # The ESEARCH result is a compact UID set such as 1:40,52 (RFC 4731)
+            status, _ = imap.uid('SEARCH', 'RETURN', '(ALL)', 'UNSEEN')
+            _, data = imap.response('ESEARCH')
+            email_ids = []
+            if status == "OK" and data and data[0]:
+                result = parse_imap_response(data[:1])
+                for name, value in zip(result, result[1:]):
+                    if isinstance(name, bytes) and name.upper() == b'ALL':
+                        email_ids = newest_uids(str(value) if isinstance(value, int) else value.decode(), MAX_EMAILS_PER_CHECK)
+                        break
+        else:
+            status, messages = imap.uid('SEARCH', None, 'UNSEEN')  # Search for unread messages
+            if status != "OK":
+                log.warning("No unread emails found.")
+                return []
+
+            # Select the most recent email UIDs (highest first) without sorting the whole list
+            email_ids = heapq.nlargest(MAX_EMAILS_PER_CHECK, messages[0].split(), key=int)
 
-        email_ids = messages[0].split()  # Get a list of email IDs
         if not email_ids:
-            logging.info("No unread emails found.")
+            log.info("No unread emails found.")
             return []
 
-        # Convert email IDs to integers and sort in descending order (most recent first)
-        email_ids = [int(eid) for eid in email_ids]
-        email_ids.sort(reverse=True)
-        # Take the 5 most recent email IDs
-        email_ids = email_ids[:5]
-        # Convert email IDs back to strings and encode to bytes
-        email_ids = [str(eid).encode() for eid in email_ids]
+        # Fetch the headers we need and the MIME structure of all messages in one round-trip
+        uid_set = b','.join(email_ids)
+        res, data = imap.uid('FETCH', uid_set, "(UID BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS (FROM SUBJECT)])")
+        fetched = {}
+        for items in parse_fetch_response(data).values():
+            if b'UID' in items and b'BODYSTRUCTURE' in items:
+                fetched[str(items[b'UID']).encode()] = items
 
         emails = []
         for email_id in email_ids:
-            res, msg = imap.fetch(email_id, "(RFC822)")
-            for response in msg:
-                if isinstance(response, tuple):
-                    # Parse the email message from bytes
-                    msg = email.message_from_bytes(response[1])
-                    emails.append((email_id, msg))  # Append the email ID and message object to the list
+            items = fetched.get(email_id)
+            if items is None:
+                continue
+            msg = BytesHeaderParser().parsebytes(get_fetch_item(items, b'BODY[HEADER') or b'')
+            emails.append((email_id, msg, find_body_part(items[b'BODYSTRUCTURE'] or [])))
         return emails
     except Exception as e:
-        logging.error(f"Failed to fetch emails: {e}")
+        log.error("Failed to fetch emails: %s", e)
         return []
 
 
-def extract_email_body(msg):
+def fetch_email_bodies(imap, emails, limit=BODY_FETCH_LIMIT):
     """
-    Extract the plain text body from an email message object.
+    Download and decode the plain text bodies of the given emails.
 
     Args:
-        msg (email.message.EmailMessage): The email message object.
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with the inbox selected.
+        emails (list): (email UID, text part) pairs, where the text part is the
+            (section, encoding, charset, subtype) tuple returned by fetch_unread_emails(), or None.
+        limit (int): Maximum number of bytes to download per plain text body. HTML bodies
+            always get BODY_FETCH_LIMIT, since their markup comes before most of the text.
 
     Returns:
-        str: The plain text body of the email.
+        dict: Email UID mapped to its plain text body; emails without a text part are omitted.
     """
+    # Group the messages by the section and size limit of their text part, so the
+    # bodies are fetched with one command per group (usually just one)
+    sections = {}
+    text_parts = {}
+    for email_id, text_part in emails:
+        if text_part:
+            text_parts[email_id] = text_part
+            section_limit = limit if text_part[3] == 'plain' else BODY_FETCH_LIMIT
+            sections.setdefault((text_part[0], section_limit), []).append(email_id)
+
+    bodies = {}
     try:
-        if msg.is_multipart():
-            # The email is multipart, so we need to iterate over its parts
-            for part in msg.walk():
-                # Check if the part is plain text and not an attachment
-                if part.get_content_type() == "text/plain" and not part.get("Content-Disposition"):
-                    # Decode the content from bytes to string using UTF-8 encoding
-                    return part.get_payload(decode=True).decode("utf-8", errors='ignore')
-            # If no plain text part is found, return an empty string
-            return ""
+        # BODY.PEEK leaves the \Seen flag untouched
+        for (section, section_limit), uids in sections.items():
+            res, data = imap.uid('FETCH', b','.join(uids), f"(UID BODY.PEEK[{section}]<0.{section_limit}>)")
+            for items in parse_fetch_response(data).values():
+                payload = get_fetch_item(items, f"BODY[{section}]".encode())
+                email_id = str(items.get(b'UID')).encode()
+                if email_id in text_parts and payload:
+                    _, encoding, charset, subtype = text_parts[email_id]
+                    body = decode_body_part(payload, encoding, charset)
+                    bodies[email_id] = html_to_text(body) if subtype == 'html' else body
+    except Exception as e:
+        log.error("Failed to fetch email bodies: %s", e)
+    return bodies
+
+
+def newest_uids(uid_set, count):
+    """
+    Pick the highest UIDs from an IMAP sequence set such as '1:40,52'.
+
+    Args:
+        uid_set (str): The sequence set returned by the server.
+        count (int): Maximum number of UIDs to return.
+
+    Returns:
+        list: Up to count UIDs as bytes, highest first.
+    """
+    uids = set()
+    for item in uid_set.split(','):
+        first, _, last = item.partition(':')
+        low, high = sorted((int(first), int(last or first)))
+        # Only the top count UIDs of a range can end up in the result
+        uids.update(range(max(low, high - count + 1), high + 1))
+    return [str(uid).encode() for uid in sorted(uids, reverse=True)[:count]]
+
+
+def parse_imap_response(data):
+    """
+    Parse raw response data returned by imaplib into nested Python lists.
+
+    Parenthesized lists become lists, NIL becomes None, numbers become ints and
+    quoted strings, literals and other atoms become bytes.
+
+    Args:
+        data (list): Response data as returned by imaplib (bytes lines and literal tuples).
+
+    Returns:
+        list: The parsed top-level values.
+    """
+    # Reassemble the response stream; imaplib splits literals out into (line, literal) tuples
+    stream = b''.join(
+        item[0] + b'\r\n' + item[1] if isinstance(item, tuple) else item + b'\r\n'
+        for item in data if item is not None
+    )
+    stack = [[]]
+    pos = 0
+    length = len(stream)
+    while pos < length:
+        char = stream[pos:pos + 1]
+        if char in (b' ', b'\r', b'\n'):
+            pos += 1
+        elif char == b'(':
+            stack.append([])
+            pos += 1
+        elif char == b')':
+            values = stack.pop()
+            stack[-1].append(values)
+            pos += 1
+        elif char == b'"':
+            # Quoted string with backslash escapes
+            value = bytearray()
+            pos += 1
+            while pos < length and stream[pos:pos + 1] != b'"':
+                if stream[pos:pos + 1] == b'\\':
+                    pos += 1
+                value += stream[pos:pos + 1]
+                pos += 1
+            stack[-1].append(bytes(value))
+            pos += 1
+        elif char == b'{':
+            # Literal: {size} followed by CRLF and exactly size bytes
+            end = stream.index(b'}', pos)
+            size = int(stream[pos + 1:end])
+            start = end + 3
+            stack[-1].append(stream[start:start + size])
+            pos = start + size
         else:
-            # The email is not multipart; decode the payload directly
-            return msg.get_payload(decode=True).decode("utf-8", errors='ignore')
+            # Atom; section specifiers such as BODY[HEADER.FIELDS (FROM)] may contain spaces
+            start = pos
+            while pos < length and stream[pos:pos + 1] not in (b' ', b'(', b')', b'\r', b'\n'):
+                if stream[pos:pos + 1] == b'[':
+                    pos = stream.index(b']', pos)
+                pos += 1
+            atom = stream[start:pos]
+            if atom.upper() == b'NIL':
+                stack[-1].append(None)
+            elif atom.isdigit():
+                stack[-1].append(int(atom))
+            else:
+                stack[-1].append(atom)
+    return stack[0]
+
+
+def parse_fetch_response(data):
+    """
+    Parse the response data of an IMAP FETCH command.
+
+    Args:
+        data (list): Response data as returned by imaplib's fetch().
+
+    Returns:
+        dict: Message number mapped to a dict of upper-cased FETCH item names and their values.
+    """
+    parsed = parse_imap_response(data)
+    messages = {}
+    for msg_num, items in zip(parsed[::2], parsed[1::2]):
+        if isinstance(items, list):
+            messages[msg_num] = {
+                name.upper() if isinstance(name, bytes) else name: value
+                for name, value in zip(items[::2], items[1::2])
+            }
+    return messages
+
+
+def get_fetch_item(items, prefix):
+    """
+    Look up a FETCH item whose name starts with the given prefix.
+
+    Servers may echo section specifiers such as HEADER.FIELDS differently, so items
+    are matched by prefix rather than by exact name.
+
+    Args:
+        items (dict): FETCH items of a single message, as returned by parse_fetch_response().
+        prefix (bytes): Upper-case prefix of the item name, e.g. b'BODY[HEADER'.
+
+    Returns:
+        The item value, or None if the message has no such item.
+    """
+    for name, value in items.items():
+        if isinstance(name, bytes) and name.startswith(prefix):
+            return value
+    return None
+
+
+def find_text_part(structure, section='', subtype=b'plain'):
+    """
+    Locate the first text part of a message with the given subtype that is not an attachment.
+
+    Args:
+        structure (list): A parsed BODYSTRUCTURE (or a nested part of one).
+        section (str): The IMAP section number of the structure ('' for the whole message).
+        subtype (bytes): The lower-cased text subtype to look for, e.g. b'plain' or b'html'.
+
+    Returns:
+        tuple: (section, content transfer encoding, charset, subtype) of the part, or None if there is none.
+    """
+    if not structure:
+        return None
+
+    if isinstance(structure[0], list):
+        # Multipart: the child parts come first, followed by the multipart subtype
+        for index, part in enumerate(structure, 1):
+            if not isinstance(part, list):
+                break
+            found = find_text_part(part, f"{section}.{index}" if section else str(index), subtype)
+            if found:
+                return found
+        return None
+
+    maintype = (structure[0] or b'').lower()
+    part_subtype = (structure[1] or b'').lower()
+    # A single-part message is used as-is as long as it is text
+    if maintype != b'text' or (section and part_subtype != subtype):
+        return None
+
+    # For text parts the disposition follows type, subtype, params, id, description,
+    # encoding, size, line count and MD5
+    disposition = structure[9] if len(structure) > 9 else None
+    if isinstance(disposition, list) and disposition and (disposition[0] or b'').lower() == b'attachment':
+        return None
+
+    params = structure[2] if isinstance(structure[2], list) else []
+    charset = None
+    for name, value in zip(params[::2], params[1::2]):
+        if isinstance(name, bytes) and name.lower() == b'charset' and value:
+            charset = value.decode('ascii', errors='ignore')
+    return (
+        section or '1',
+        (structure[5] or b'7bit').decode('ascii', errors='ignore').lower(),
+        charset,
+        part_subtype.decode('ascii', errors='ignore')
+    )
+
+
+def find_body_part(structure):
+    """
+    Locate the part of a message to use as its body: the first plain text part, or the
+    first HTML part for messages that have no plain text alternative.
+
+    Args:
+        structure (list): A parsed BODYSTRUCTURE.
+
+    Returns:
+        tuple: (section, content transfer encoding, charset, subtype) of the part, or None if there is none.
+    """
+    return find_text_part(structure) or find_text_part(structure, subtype=b'html')
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Collect the visible text of an HTML document, with line breaks at block elements.
+    """
+
+    BLOCK_TAGS = frozenset({
+        'blockquote', 'br', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'li', 'p', 'table', 'tr'
+    })
+    HIDDEN_TAGS = frozenset({'head', 'script', 'style', 'title'})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.hidden_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HIDDEN_TAGS:
+            self.hidden_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.HIDDEN_TAGS:
+            self.hidden_depth = max(0, self.hidden_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self.hidden_depth:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    """
+    Convert an HTML body, possibly truncated, into plain text.
+
+    Args:
+        html (str): The HTML markup.
+
+    Returns:
+        str: The visible text, with whitespace collapsed and blank lines removed.
+    """
+    parser = HTMLTextExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as e:
+        log.error("Failed to convert HTML body to text: %s", e)
+    lines = (' '.join(line.split()) for line in ''.join(parser.parts).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def header_text(value):
+    """
+    Convert a header value from the compat32 header parser into a plain string.
+
+    Headers with undeclared 8-bit bytes (usually raw UTF-8) come back as unhashable
+    email.header.Header objects; their bytes are decoded as UTF-8 here, falling back
+    to Latin-1.
+
+    Args:
+        value (str or email.header.Header): The header value, or None.
+
+    Returns:
+        str: The header text, or None if there is none.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    parts = []
+    for part, charset in decode_header(value):
+        if isinstance(part, str):
+            parts.append(part)
+            continue
+        try:
+            parts.append(part.decode('utf-8' if charset in (None, 'unknown-8bit') else charset))
+        except (LookupError, UnicodeDecodeError):
+            parts.append(part.decode('latin-1'))
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_sender(raw_sender):
+    """
+    Extract the lower-cased email address from a raw From header.
+
+    Results are cached since the same senders keep coming back.
+
+    Args:
+        raw_sender (str): The raw header value, or None.
+
+    Returns:
+        str: The sender's address, or an empty string if there is none.
+    """
+    if not raw_sender:
+        return ""
+    return parseaddr(raw_sender)[1].lower()
+
+
+@functools.lru_cache(maxsize=256)
+def decode_subject(raw_subject):
+    """
+    Decode a raw Subject header, including RFC 2047 encoded words, into text.
+
+    Results are cached since replies in a thread repeat the same encoded subject.
+
+    Args:
+        raw_subject (str): The raw header value, possibly folded, or None.
+
+    Returns:
+        str: The decoded subject, or an empty string if there is none.
+    """
+    if not raw_subject:
+        return ""
+    # Unfold the header before handing it to the modern header registry
+    return str(email_policy.default.header_factory('subject', ''.join(raw_subject.splitlines())))
+
+
+def trim_base64(payload):
+    """
+    Cut a base64 payload back to its last complete 4-character group.
+
+    A partial fetch can end in the middle of a group, and a leftover single character
+    makes the email package give up and return the encoded text as-is.
+
+    Args:
+        payload (bytes): The raw, possibly truncated, base64 data.
+
+    Returns:
+        bytes: The payload without the trailing incomplete group.
+    """
+    excess = len(payload.translate(None, b' \t\r\n')) % 4
+    end = len(payload)
+    while excess:
+        end -= 1
+        if payload[end] not in b' \t\r\n':
+            excess -= 1
+    return payload[:end]
+
+
+def decode_body_part(payload, encoding, charset):
+    """
+    Decode a fetched body part into text.
+
+    Args:
+        payload (bytes): The raw, possibly truncated, body part.
+        encoding (str): The part's content transfer encoding (e.g. 'base64', 'quoted-printable').
+        charset (str): The part's character set, or None for UTF-8.
+
+    Returns:
+        str: The decoded text.
+    """
+    try:
+        # Wrap the part in a message so the email package handles transfer encoding and charset
+        part = EmailMessage()
+        part['Content-Type'] = 'text/plain'
+        part.set_param('charset', charset or 'utf-8')
+        part['Content-Transfer-Encoding'] = encoding
+        if encoding == 'base64':
+            payload = trim_base64(payload)
+        part.set_payload(payload.decode('ascii', 'surrogateescape'))
+        try:
+            return part.get_content(errors='ignore')
+        except LookupError:
+            # Unknown charset
+            return part.get_payload(decode=True).decode('utf-8', errors='ignore')
     except Exception as e:
-        logging.error(f"Failed to extract email body: {e}")
+        log.error("Failed to decode email body: %s", e)
         return ""
 
 
-def mark_as_read(imap, email_id):
+def read_ahead(imap):
+    """
+    Take the response data imaplib has already read into its buffer, without blocking.
+
+    imaplib reads from the socket through a buffered file, which can hold responses that
+    arrived right after the last tagged reply; select() on the socket cannot see them.
+
+    Args:
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection.
+
+    Returns:
+        bytes: The buffered data (plus anything readable right away), or b'' if there is none.
     """
-    Mark an email as read on the IMAP server using the email ID.
+    sock = imap.sock
+    timeout = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        # read1() returns the buffered bytes, or makes one non-blocking read if there are none
+        return imap.file.read1(65536) or b''
+    except (ssl.SSLWantReadError, BlockingIOError):
+        return b''
+    finally:
+        sock.settimeout(timeout)
+
+
+def idle_wait(imap, timeout, wakeup_sock=None):
+    """
+    Block in an IMAP IDLE session (RFC 2177) until the server pushes new mail.
+
+    The IDLE exchange is read straight from the socket so the wait can be interrupted
+    by the wakeup socket without polling.
+
+    Args:
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with a mailbox selected.
+        timeout (float): Maximum number of seconds to stay in IDLE.
+        wakeup_sock (socket.socket): Optional socket that ends the wait when it becomes readable.
+
+    Returns:
+        bool: True if the server reported new messages, False on timeout or wakeup.
+    """
+    sock = imap.sock
+    watched = [sock] if wakeup_sock is None else [sock, wakeup_sock]
+    deadline = time.monotonic() + timeout
+    # Start with whatever imaplib already buffered, e.g. an EXISTS sent after the last reply
+    pending = read_ahead(imap)
+    idling = done = completed = new_mail = False
+
+    imap.send(IDLE_TAG + b' IDLE\r\n')
+    while True:
+        # Handle every complete response line received so far
+        while b'\r\n' in pending:
+            line, pending = pending.split(b'\r\n', 1)
+            if line.startswith(IDLE_TAG + b' '):
+                # Tagged completion of the IDLE command
+                if not line.startswith(IDLE_TAG + b' OK'):
+                    raise imaplib.IMAP4.error(f"IDLE failed: {line.decode(errors='replace')}")
+                completed = True
+            elif line.startswith(b'+'):
+                idling = True
+            elif line.endswith((b' EXISTS', b' RECENT')):
+                new_mail = True
+        # Lines received after the tagged reply are still checked above; only return once
+        # no partial line is left that imaplib would otherwise choke on
+        if completed and not pending:
+            return new_mail
+
+        if idling and not done:
+            wake = new_mail
+            # Data already decrypted by the SSL layer will not show up in select()
+            if not wake and not sock.pending():
+                remaining = deadline - time.monotonic()
+                readable = []
+                if remaining > 0:
+                    readable, _, _ = select.select(watched, [], [], remaining)
+                if wakeup_sock is not None and wakeup_sock in readable:
+                    wakeup_sock.recv(64)
+                    wake = True
+                elif not readable:
+                    wake = True
+            if wake:
+                imap.send(b'DONE\r\n')
+                done = True
+                continue
+
+        data = sock.recv(4096)
+        if not data:
+            raise imaplib.IMAP4.abort("Connection closed by server during IDLE.")
+        pending += data
+
+
+def noop_wait(imap, timeout, stop_event):
+    """
+    Wait for new mail on servers without IDLE support by sending periodic NOOP keep-alives.
+
+    Args:
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with a mailbox selected.
+        timeout (float): Maximum number of seconds to wait.
+        stop_event (threading.Event): Event that ends the wait when set.
+
+    Returns:
+        bool: True if the server reported new messages, False on timeout or stop.
+    """
+    # Discard counts left over from SELECT so only new responses are reported
+    imap.response('EXISTS')
+    imap.response('RECENT')
+
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or stop_event.wait(min(NOOP_INTERVAL, remaining)):
+            return False
+        imap.noop()
+        exists = imap.response('EXISTS')[1][0]
+        recent = imap.response('RECENT')[1][0]
+        if exists is not None or recent is not None:
+            return True
+
+
+def reconnect_delay(failures, interval):
+    """
+    Compute how long to wait before reconnecting after failed connection attempts.
+
+    The delay doubles with every consecutive failure, starting at the check interval and
+    capped at RECONNECT_MAX_DELAY (or the check interval, if that is longer). Random
+    jitter keeps clients from retrying in lockstep when a server comes back.
+
+    Args:
+        failures (int): Number of consecutive failed attempts, at least 1.
+        interval (int): The check interval in seconds.
+
+    Returns:
+        float: The number of seconds to wait.
+    """
+    cap = max(interval, RECONNECT_MAX_DELAY)
+    return min(cap, interval * 2 ** min(failures - 1, 16) + random.uniform(0, interval))
+
+
+def mark_as_read(imap, email_ids):
+    """
+    Mark emails as read on the IMAP server using their UIDs, with a single STORE command.
 
     Args:
         imap (imaplib.IMAP4_SSL): An authenticated IMAP connection object.
-        email_id (bytes): The email ID to mark as read.
+        email_ids (list): The email UIDs (bytes) to mark as read.
 
     Returns:
         bool: True if successful, False otherwise.
     """
+    uid_set = b','.join(email_ids).decode()
     try:
-        imap.store(email_id, '+FLAGS', '\\Seen')
-        logging.info(f"Marked email {email_id.decode()} as read.")
+        status, _ = imap.uid('STORE', uid_set, '+FLAGS', '(\\Seen)')
+        if status != "OK":
+            log.error("Failed to mark email(s) %s as read: %s", uid_set, status)
+            return False
+        log.info("Marked email(s) %s as read.", uid_set)
         return True
     except Exception as e:
-        logging.error(f"Failed to mark email {email_id.decode()} as read: {e}")
+        log.error("Failed to mark email(s) %s as read: %s", uid_set, e)
         return False
 
 
 # Notification functions (implementations for each notification method)
 
+def get_twilio_client(account_sid, auth_token):
+    """
+    Return a cached Twilio client for the given credentials, creating it on first use.
+
+    Args:
+        account_sid (str): Twilio account SID.
+        auth_token (str): Twilio authentication token.
+
+    Returns:
+        Client: The Twilio REST client.
+    """
+    key = (account_sid, auth_token)
+    with _TWILIO_CLIENTS_LOCK:
+        client = _TWILIO_CLIENTS.get(key)
+        if client is None:
+            client = _TWILIO_CLIENTS[key] = Client(
+                account_sid, auth_token, http_client=TwilioHttpClient(timeout=HTTP_TIMEOUT[1]))
+        return client
+
+
+def get_slack_client(token):
+    """
+    Return a cached Slack client for the given token, creating it on first use.
+
+    Args:
+        token (str): Slack Bot User OAuth Token.
+
+    Returns:
+        WebClient: The Slack Web API client.
+    """
+    with _SLACK_CLIENTS_LOCK:
+        client = _SLACK_CLIENTS.get(token)
+        if client is None:
+            client = _SLACK_CLIENTS[token] = WebClient(token=token, timeout=HTTP_TIMEOUT[1])
+        return client
+
+
 def send_sms_via_twilio(account_sid, auth_token, from_number, to_number, body):
     """
     Send an SMS message using the Twilio API.
@@ -295,16 +1072,16 @@ def send_sms_via_twilio(account_sid, auth_token, from_number, to_number, body):
         str: Message SID if successful, None otherwise.
     """
     try:
-        client = Client(account_sid, auth_token)
+        client = get_twilio_client(account_sid, auth_token)
         message = client.messages.create(
             body=body,
             from_=from_number,
             to=to_number
         )
-        logging.info(f"Sent SMS to {to_number} with SID: {message.sid}")
+        log.info("Sent SMS to %s with SID: %s", to_number, message.sid)
         return message.sid
     except Exception as e:
-        logging.error(f"Failed to send SMS to {to_number}: {e}")
+        log.error("Failed to send SMS to %s: %s", to_number, e)
         return None
 
 
@@ -323,16 +1100,19 @@ def make_voice_call(account_sid, auth_token, from_number, to_number, message):
         str: Call SID if successful, None otherwise.
     """
     try:
-        client = Client(account_sid, auth_token)
+        client = get_twilio_client(account_sid, auth_token)
+        # VoiceResponse escapes the message so characters such as < and & produce valid TwiML
+        response = VoiceResponse()
+        response.say(message)
         call = client.calls.create(
-            twiml=f'<Response><Say>{message}</Say></Response>',
+            twiml=str(response),
             from_=from_number,
             to=to_number
         )
-        logging.info(f"Initiated voice call to {to_number} with SID: {call.sid}")
+        log.info("Initiated voice call to %s with SID: %s", to_number, call.sid)
         return call.sid
     except Exception as e:
-        logging.error(f"Failed to make voice call to {to_number}: {e}")
+        log.error("Failed to make voice call to %s: %s", to_number, e)
         return None
 
 
@@ -351,16 +1131,16 @@ def send_whatsapp_message(account_sid, auth_token, from_number, to_number, body)
         str: Message SID if successful, None otherwise.
     """
     try:
-        client = Client(account_sid, auth_token)
+        client = get_twilio_client(account_sid, auth_token)
         message = client.messages.create(
             body=body,
             from_=from_number,
             to=to_number
         )
-        logging.info(f"Sent WhatsApp message to {to_number} with SID: {message.sid}")
+        log.info("Sent WhatsApp message to %s with SID: %s", to_number, message.sid)
         return message.sid
     except Exception as e:
-        logging.error(f"Failed to send WhatsApp message to {to_number}: {e}")
+        log.error("Failed to send WhatsApp message to %s: %s", to_number, e)
         return None
 
 
@@ -378,29 +1158,29 @@ def send_slack_message(token, channel, subject, body):
         str: Timestamp of the message if successful, None otherwise.
     """
     if not token or not channel:
-        logging.warning("Slack token or channel not configured properly.")
+        log.warning("Slack token or channel not configured properly.")
         return None
 
     if not channel.startswith('#'):
         channel = f'#{channel}'
 
     try:
-        client = WebClient(token=token)
+        client = get_slack_client(token)
         # Format the subject in bold by wrapping it with asterisks
         formatted_body = f"*{subject}*\n{body}"
 
         response = client.chat_postMessage(
             channel=channel,
             text=formatted_body,
-            parse='full'  # Enable parsing of markup (e.g., bold, italics)
+            mrkdwn=True  # Format *bold* markup without full server-side re-parsing
         )
-        logging.info(f"Sent Slack message with timestamp: {response['ts']}")
+        log.info("Sent Slack message with timestamp: %s", response['ts'])
         return response["ts"]
     except SlackApiError as e:
-        logging.error(f"Failed to send Slack message: {e.response['error']}")
+        log.error("Failed to send Slack message: %s", e.response['error'])
         return None
     except Exception as e:
-        logging.error(f"Unexpected error sending Slack message: {e}")
+        log.error("Unexpected error sending Slack message: %s", e)
         return None
 
 
@@ -418,22 +1198,22 @@ def send_telegram_message(bot_token, chat_id, subject, body):
         bool: True if successful, False otherwise.
     """
     try:
-        message = f"*{subject}*\n{body}"
+        message = f"*{subject.translate(_TELEGRAM_ESCAPE)}*\n{body.translate(_TELEGRAM_ESCAPE)}"
         url = f'https://api.telegram.org/bot{bot_token}/sendMessage'
         params = {
             'chat_id': chat_id,
             'text': message,
-            'parse_mode': 'Markdown'
+            'parse_mode': 'MarkdownV2'
         }
-        response = requests.post(url, data=params)
+        response = _HTTP_SESSION.post(url, data=params, timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
-            logging.info("Sent Telegram message.")
+            log.info("Sent Telegram message.")
             return True
         else:
-            logging.error(f"Failed to send Telegram message: {response.status_code} {response.text}")
+            log.error("Failed to send Telegram message: %s %s", response.status_code, response.text)
             return False
     except Exception as e:
-        logging.error(f"Failed to send Telegram message: {e}")
+        log.error("Failed to send Telegram message: %s", e)
         return False
 
 
@@ -450,18 +1230,21 @@ def send_discord_message(webhook_url, subject, body):
         bool: True if successful, False otherwise.
     """
     try:
-        data = {
-            "content": f"**{subject}**\n{body}"
-        }
-        response = requests.post(webhook_url, json=data)
+        content = f"**{subject.translate(_DISCORD_ESCAPE)}**\n{body.translate(_DISCORD_ESCAPE)}"
+        response = _HTTP_SESSION.post(
+            webhook_url,
+            data=_DISCORD_TEMPLATE % encode_json(content),
+            headers=_JSON_HEADERS,
+            timeout=HTTP_TIMEOUT
+        )
         if response.status_code in [200, 204]:
-            logging.info("Sent Discord message.")
+            log.info("Sent Discord message.")
             return True
         else:
-            logging.error(f"Failed to send Discord message: {response.status_code} {response.text}")
+            log.error("Failed to send Discord message: %s %s", response.status_code, response.text)
             return False
     except Exception as e:
-        logging.error(f"Failed to send Discord message: {e}")
+        log.error("Failed to send Discord message: %s", e)
         return False
 
 
@@ -477,44 +1260,292 @@ def send_custom_webhook(webhook_url, payload):
         bool: True if successful, False otherwise.
     """
     try:
-        response = requests.post(webhook_url, json=payload)
+        response = _HTTP_SESSION.post(webhook_url, data=encode_json(payload), headers=_JSON_HEADERS, timeout=HTTP_TIMEOUT)
         if response.status_code in [200, 201, 202]:
-            logging.info("Sent custom webhook.")
+            log.info("Sent custom webhook.")
             return True
         else:
-            logging.error(f"Failed to send custom webhook: {response.status_code} {response.text}")
+            log.error("Failed to send custom webhook: %s %s", response.status_code, response.text)
             return False
     except Exception as e:
-        logging.error(f"Failed to send custom webhook: {e}")
+        log.error("Failed to send custom webhook: %s", e)
         return False
 
 
+@dataclass(frozen=True, slots=True)
+class NotificationChannel:
+    """
+    One enabled notification destination, e.g. a single SMS recipient.
+
+    kwargs holds the sender arguments that do not depend on the email, read-only since
+    a channel is shared by all emails; content names the entry of notification_content()
+    that supplies the rest.
+    """
+    func: object
+    kwargs: MappingProxyType
+    content: str
+
+    def __post_init__(self):
+        # Frozen only stops rebinding kwargs, so take a read-only copy of the mapping
+        object.__setattr__(self, 'kwargs', MappingProxyType(dict(self.kwargs)))
+
+
+def notification_content(subject, body, max_sms_length):
+    """
+    Build the email-dependent sender arguments for each kind of notification content.
+
+    Args:
+        subject (str): The decoded email subject.
+        body (str): The email body.
+        max_sms_length (int): Maximum length of an SMS, not counting the '...' marking a cut.
+
+    Returns:
+        dict: Sender keyword arguments keyed by NotificationChannel.content.
+    """
+    notification_message = f"{subject}: {body}"
+    sms_body = (notification_message[:max_sms_length] + '...') if len(notification_message) > max_sms_length else notification_message
+    return {
+        'sms': {'body': sms_body},
+        'message': {'message': notification_message},
+        'text': {'body': notification_message},
+        'subject_body': {'subject': subject, 'body': body},
+        'payload': {'payload': {'subject': subject, 'body': body}},
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class MonitorSettings:
+    """
+    Immutable snapshot of the settings used by the monitoring loop.
+
+    Built once from the configuration so the loop does not re-read and re-split
+    config.ini values on every iteration.
+    """
+    imap_server: str
+    imap_port: int
+    username: str
+    password: str
+    filter_exact: frozenset
+    filter_domains: frozenset
+    check_interval: int
+    max_sms_length: int
+    twilio_sms_enabled: bool
+    twilio_sms_account_sid: str
+    twilio_sms_auth_token: str
+    twilio_sms_from_number: str
+    twilio_sms_destination_numbers: tuple
+    voice_enabled: bool
+    voice_account_sid: str
+    voice_auth_token: str
+    voice_from_number: str
+    voice_destination_numbers: tuple
+    whatsapp_enabled: bool
+    whatsapp_account_sid: str
+    whatsapp_auth_token: str
+    whatsapp_from_number: str
+    whatsapp_to_numbers: tuple
+    slack_enabled: bool
+    slack_token: str
+    slack_channel: str
+    telegram_enabled: bool
+    telegram_bot_token: str
+    telegram_chat_id: str
+    discord_enabled: bool
+    discord_webhook_url: str
+    custom_webhook_enabled: bool
+    custom_webhook_url: str
+    # The enabled notification destinations, built once per snapshot in __post_init__
+    channels: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # The snapshot is frozen, so the derived field has to be set through object
+        object.__setattr__(self, 'channels', self._build_channels())
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a settings snapshot from configuration data.
+
+        Args:
+            config (configparser.ConfigParser): Configuration data loaded from config.ini.
+
+        Returns:
+            MonitorSettings: The settings snapshot.
+
+        Raises:
+            ValueError: If a numeric setting is not a valid integer.
+        """
+        email_section = config['Email']
+        settings_section = config['Settings']
+        filter_entries = [addr.strip().lower() for addr in email_section.get('filter_emails', '').split(',') if addr.strip()]
+        return cls(
+            imap_server=email_section.get('imap_server'),
+            imap_port=int(email_section.get('imap_port')),
+            username=email_section.get('username'),
+            password=email_section.get('password'),
+            filter_exact=frozenset(entry for entry in filter_entries if not entry.startswith('@')),
+            filter_domains=frozenset(entry[1:] for entry in filter_entries if entry.startswith('@')),
+            check_interval=int(settings_section.get('check_interval', '60')),
+            max_sms_length=int(settings_section.get('max_sms_length', '1600')),
+            twilio_sms_enabled=config.getboolean('Twilio', 'enabled', fallback=False),
+            twilio_sms_account_sid=config.get('Twilio', 'account_sid', fallback=''),
+            twilio_sms_auth_token=config.get('Twilio', 'auth_token', fallback=''),
+            twilio_sms_from_number=config.get('Twilio', 'from_number', fallback=''),
+            twilio_sms_destination_numbers=tuple(num.strip() for num in config.get('Twilio', 'destination_number', fallback='').split(',') if num.strip()),
+            voice_enabled=config.getboolean('Voice', 'enabled', fallback=False),
+            voice_account_sid=config.get('Voice', 'account_sid', fallback=''),
+            voice_auth_token=config.get('Voice', 'auth_token', fallback=''),
+            voice_from_number=config.get('Voice', 'from_number', fallback=''),
+            voice_destination_numbers=tuple(num.strip() for num in config.get('Voice', 'destination_number', fallback='').split(',') if num.strip()),
+            whatsapp_enabled=config.getboolean('WhatsApp', 'enabled', fallback=False),
+            whatsapp_account_sid=config.get('WhatsApp', 'account_sid', fallback=''),
+            whatsapp_auth_token=config.get('WhatsApp', 'auth_token', fallback=''),
+            whatsapp_from_number=config.get('WhatsApp', 'from_number', fallback=''),
+            whatsapp_to_numbers=tuple(num.strip() for num in config.get('WhatsApp', 'to_number', fallback='').split(',') if num.strip()),
+            slack_enabled=config.getboolean('Slack', 'enabled', fallback=False),
+            slack_token=config.get('Slack', 'token', fallback=''),
+            slack_channel=config.get('Slack', 'channel', fallback=''),
+            telegram_enabled=config.getboolean('Telegram', 'enabled', fallback=False),
+            telegram_bot_token=config.get('Telegram', 'bot_token', fallback=''),
+            telegram_chat_id=config.get('Telegram', 'chat_id', fallback=''),
+            discord_enabled=config.getboolean('Discord', 'enabled', fallback=False),
+            discord_webhook_url=config.get('Discord', 'webhook_url', fallback=''),
+            custom_webhook_enabled=config.getboolean('CustomWebhook', 'enabled', fallback=False),
+            custom_webhook_url=config.get('CustomWebhook', 'webhook_url', fallback='')
+        )
+
+    @property
+    def body_fetch_limit(self):
+        """
+        Number of plain text body bytes worth downloading per email.
+
+        When SMS is the only enabled notification method the message is cut to
+        max_sms_length characters anyway, so there is no need to fetch more.
+        HTML bodies are not capped; see fetch_email_bodies().
+        """
+        if self.twilio_sms_enabled and not any([
+            self.voice_enabled, self.whatsapp_enabled, self.slack_enabled, self.telegram_enabled,
+            self.discord_enabled, self.custom_webhook_enabled
+        ]):
+            return min(BODY_FETCH_LIMIT, self.max_sms_length * SMS_FETCH_BYTES_PER_CHAR)
+        return BODY_FETCH_LIMIT
+
+    def matches_filter(self, sender_email):
+        """
+        Check a sender against the configured email filter.
+
+        Args:
+            sender_email (str): The lower-cased sender address.
+
+        Returns:
+            bool: True if no filter is configured or the address or its domain is listed.
+        """
+        if not self.filter_exact and not self.filter_domains:
+            return True
+        if sender_email in self.filter_exact:
+            return True
+        _, at, domain = sender_email.rpartition('@')
+        return bool(at) and domain in self.filter_domains
+
+    def _build_channels(self):
+        """
+        List the enabled notification destinations.
+
+        Called once per settings snapshot, so the monitoring loop only has to fill in
+        the email content for each destination.
+
+        Returns:
+            tuple: A NotificationChannel for every enabled method and recipient.
+        """
+        channels = []
+        if self.twilio_sms_enabled:
+            for to_number in self.twilio_sms_destination_numbers:
+                channels.append(NotificationChannel(send_sms_via_twilio, dict(
+                    account_sid=self.twilio_sms_account_sid,
+                    auth_token=self.twilio_sms_auth_token,
+                    from_number=self.twilio_sms_from_number,
+                    to_number=to_number
+                ), 'sms'))
+        if self.voice_enabled:
+            for to_number in self.voice_destination_numbers:
+                channels.append(NotificationChannel(make_voice_call, dict(
+                    account_sid=self.voice_account_sid,
+                    auth_token=self.voice_auth_token,
+                    from_number=self.voice_from_number,
+                    to_number=to_number
+                ), 'message'))
+        if self.whatsapp_enabled:
+            for to_number in self.whatsapp_to_numbers:
+                channels.append(NotificationChannel(send_whatsapp_message, dict(
+                    account_sid=self.whatsapp_account_sid,
+                    auth_token=self.whatsapp_auth_token,
+                    from_number=self.whatsapp_from_number,
+                    to_number=to_number
+                ), 'text'))
+        if self.slack_enabled:
+            channels.append(NotificationChannel(send_slack_message, dict(
+                token=self.slack_token,
+                channel=self.slack_channel
+            ), 'subject_body'))
+        if self.telegram_enabled:
+            channels.append(NotificationChannel(send_telegram_message, dict(
+                bot_token=self.telegram_bot_token,
+                chat_id=self.telegram_chat_id
+            ), 'subject_body'))
+        if self.discord_enabled:
+            channels.append(NotificationChannel(send_discord_message, dict(
+                webhook_url=self.discord_webhook_url
+            ), 'subject_body'))
+        if self.custom_webhook_enabled:
+            channels.append(NotificationChannel(send_custom_webhook, dict(
+                webhook_url=self.custom_webhook_url
+            ), 'payload'))
+        return tuple(channels)
+
+    @property
+    def any_channel_enabled(self):
+        """
+        Whether at least one notification method is enabled with a destination to send to.
+        """
+        return bool(self.channels)
+
+
 class EmailMonitorApp:
     """
     The main application class for the Email Monitoring.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, config_file=CONFIG_FILE_PATH):
         """
         Initialize the EmailMonitorApp with configuration data.
 
         Args:
             config (configparser.ConfigParser): Configuration data loaded from config.ini.
+            config_file (str): The path to the configuration INI file, watched for changes.
         """
         self.config = config
+        self.config_file = config_file
+        self.settings = None
+        self._settings_mtime = None
         self.monitoring = False
         self.monitor_thread = None
         self.imap = None
+        self._imap_login = None
         self.stop_event = threading.Event()
-
-    def start(self):
-        """
-        Start the email monitoring process.
+        self._stop_signal = None
+        # Socket pair used to interrupt a blocking IDLE wait when monitoring stops
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        # Thread pool that sends the notifications of each email in parallel
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=NOTIFICATION_WORKERS, thread_name_prefix='notify')
+
+    def validate_config(self):
         """
-        if self.monitoring:
-            logging.warning("Monitoring is already running.")
-            return
+        Validate the configuration and build the initial settings snapshot.
 
+        Returns:
+            bool: True if monitoring can start, False otherwise (a warning is logged).
+        """
         # Validate that at least one notification method is enabled
         if not any([
             self.config.getboolean('Twilio', 'enabled', fallback=False),
@@ -525,281 +1556,317 @@ class EmailMonitorApp:
             self.config.getboolean('Discord', 'enabled', fallback=False),
             self.config.getboolean('CustomWebhook', 'enabled', fallback=False)
         ]):
-            logging.warning("No notification methods enabled. Please enable at least one method in config.ini.")
-            return
+            log.warning("No notification methods enabled. Please enable at least one method in config.ini.")
+            return False
 
-        # Validate required Email settings
-        email_section = self.config['Email']
-        if not all([email_section.get('imap_server'), email_section.get('imap_port'),
-                    email_section.get('username'), email_section.get('password')]):
-            logging.warning("Incomplete Email configuration. Please ensure all fields are filled in config.ini.")
+        # Validate the Email settings and check interval while building the settings snapshot
+        try:
+            self.refresh_settings()
+        except ValueError as e:
+            log.warning("%s", e)
+            return False
+        return True
+
+    def start(self):
+        """
+        Start the email monitoring process in a background thread.
+        """
+        if self.monitoring:
+            log.warning("Monitoring is already running.")
             return
 
-        # Validate Check Interval
-        try:
-            check_interval = int(self.config['Settings'].get('check_interval', '60'))
-            if check_interval <= 0:
-                raise ValueError
-        except ValueError:
-            logging.warning("Invalid check_interval in config.ini. It must be a positive integer.")
+        if not self.validate_config():
             return
 
         self.monitoring = True
         self.stop_event.clear()
-        logging.info("Starting email monitoring.")
+        log.info("Starting email monitoring.")
         self.monitor_thread = threading.Thread(target=self.monitor_emails, daemon=True)
         self.monitor_thread.start()
 
-    def stop(self):
+    def run_forever(self):
+        """
+        Run the email monitoring loop on the calling thread until it is stopped.
+
+        Returns once stop() is called or a signal handled by handle_signal() arrives.
+        """
+        if self.monitoring:
+            log.warning("Monitoring is already running.")
+            return
+
+        if not self.validate_config():
+            return
+
+        self.monitoring = True
+        # A signal received while starting up must still stop the loop
+        if self._stop_signal is None:
+            self.stop_event.clear()
+        log.info("Starting email monitoring.")
+        try:
+            self.monitor_emails()
+        finally:
+            self.monitoring = False
+        if self._stop_signal is not None:
+            log.info("Received signal %s. Shutting down gracefully...", self._stop_signal)
+        log.info("Email monitoring stopped.")
+
+    def install_signal_handlers(self):
+        """
+        Stop monitoring on SIGINT and SIGTERM; call from the main thread before run_forever().
+
+        A first signal asks the monitoring loop to finish; a second one exits immediately.
+        """
+        # The interpreter writes the signal number to the wakeup socket, which ends a
+        # blocking IDLE wait immediately, even before the Python-level handler runs
+        self._wakeup_w.setblocking(False)
+        signal.set_wakeup_fd(self._wakeup_w.fileno())
+        signal.signal(signal.SIGINT, self.handle_signal)
+        signal.signal(signal.SIGTERM, self.handle_signal)
+
+    def handle_signal(self, sig, frame):
+        """
+        Handle termination signals by asking the monitoring loop to finish.
+
+        Args:
+            sig (int): Signal number.
+            frame (object): Current stack frame.
+
+        Raises:
+            SystemExit: On a second signal, to abandon a shutdown that is stuck in a blocking call.
+        """
+        if self.stop_event.is_set() and self._stop_signal is not None:
+            # Raising from the handler interrupts the blocking call instead of retrying it
+            raise SystemExit(128 + sig)
+        self._stop_signal = sig
+        self.stop_event.set()
+
+    def stop(self, timeout=None):
         """
         Stop the email monitoring process.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait for the monitor thread, or None to wait indefinitely.
         """
         if not self.monitoring:
-            logging.warning("Monitoring is not running.")
+            log.warning("Monitoring is not running.")
             return
 
         self.monitoring = False
         self.stop_event.set()
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass
         if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join()
-        logging.info("Email monitoring stopped.")
+            self.monitor_thread.join(timeout)
+            if self.monitor_thread.is_alive():
+                log.warning("Monitor thread did not finish within %s seconds.", timeout)
+                return
+        log.info("Email monitoring stopped.")
+
+    def refresh_settings(self):
+        """
+        Rebuild the settings snapshot if the configuration file changed on disk.
+
+        An invalid edit is logged once and the previous snapshot stays in use.
+
+        Returns:
+            MonitorSettings: The current settings snapshot.
+
+        Raises:
+            ValueError: If the configuration is invalid and there is no previous snapshot.
+        """
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            # Keep using the last snapshot if the file is temporarily unavailable
+            mtime = self._settings_mtime
+
+        if self.settings is None or mtime != self._settings_mtime:
+            config = load_config(self.config_file) if mtime is not None else self.config
+            # Remember the version even if it is invalid, so it is not re-checked every cycle
+            self._settings_mtime = mtime
+            problem = find_config_problem(config)
+            if problem is None:
+                try:
+                    settings = MonitorSettings.from_config(config)
+                except ValueError as e:
+                    problem = f"Invalid numeric setting in config.ini: {e}"
+            if problem is not None:
+                if self.settings is None:
+                    raise ValueError(problem)
+                log.warning("%s Keeping the previous settings.", problem)
+            else:
+                self.settings = settings
+                self.config = config
+        return self.settings
+
+    def disconnect_imap(self, logout=True):
+        """
+        Close the persistent IMAP connection.
+
+        Args:
+            logout (bool): Send LOGOUT first; skip this for connections that were already dropped.
+        """
+        if not self.imap:
+            return
+        try:
+            if logout:
+                self.imap.logout()
+                log.info("Logged out from IMAP server.")
+            else:
+                self.imap.shutdown()
+        except Exception as e:
+            log.error("Error while logging out from IMAP: %s", e)
+        finally:
+            self.imap = None
+
+    def ensure_connected(self, settings):
+        """
+        Return the persistent IMAP connection, logging in and selecting the inbox if needed.
+
+        The inbox is selected once per connection; IDLE and NOOP report new mail on the
+        selected mailbox, so there is no need to select it again on every check.
+
+        Args:
+            settings (MonitorSettings): The current settings snapshot.
+
+        Returns:
+            imaplib.IMAP4_SSL: The connection, or None if connecting failed.
+        """
+        login = (settings.imap_server, settings.imap_port, settings.username, settings.password)
+        if self.imap is not None and login != self._imap_login:
+            log.info("IMAP settings changed. Reconnecting...")
+            self.disconnect_imap()
+
+        if self.imap is None:
+            imap = connect_to_imap(*login)
+            if not imap:
+                return None
+            status, _ = imap.select("inbox")  # Select the inbox folder
+            if status != "OK":
+                log.error("Failed to select the inbox.")
+                self.imap = imap
+                self.disconnect_imap()
+                return None
+            self.imap = imap
+            self._imap_login = login
+        return self.imap
 
     def monitor_emails(self):
         """
         Monitor the inbox for unread emails and send notifications as configured.
         """
-        email_section = self.config['Email']
-        settings_section = self.config['Settings']
-
+        connect_failures = 0
         while not self.stop_event.is_set():
             try:
-                # Retrieve Email credentials and settings
-                IMAP_SERVER = email_section.get('imap_server')
-                IMAP_PORT = int(email_section.get('imap_port'))
-                EMAIL_USERNAME = email_section.get('username')
-                EMAIL_PASSWORD = email_section.get('password')
-                FILTER_EMAILS = [email.strip().lower() for email in email_section.get('filter_emails', '').split(',') if email.strip()]
-
-                # Retrieve Check Interval
-                CHECK_INTERVAL = int(settings_section.get('check_interval', '60'))
-
-                # Retrieve Twilio SMS configuration
-                TWILIO_SMS_ENABLED = self.config.getboolean('Twilio', 'enabled', fallback=False)
-                TWILIO_SMS_ACCOUNT_SID = self.config.get('Twilio', 'account_sid', fallback='')
-                TWILIO_SMS_AUTH_TOKEN = self.config.get('Twilio', 'auth_token', fallback='')
-                TWILIO_SMS_FROM_NUMBER = self.config.get('Twilio', 'from_number', fallback='')
-                TWILIO_SMS_DESTINATION_NUMBERS = [num.strip() for num in self.config.get('Twilio', 'destination_number', fallback='').split(',') if num.strip()]
-                MAX_SMS_LENGTH = int(settings_section.get('max_sms_length', '1600'))
-
-                # Retrieve Twilio Voice configuration
-                VOICE_ENABLED = self.config.getboolean('Voice', 'enabled', fallback=False)
-                VOICE_ACCOUNT_SID = self.config.get('Voice', 'account_sid', fallback='')
-                VOICE_AUTH_TOKEN = self.config.get('Voice', 'auth_token', fallback='')
-                VOICE_FROM_NUMBER = self.config.get('Voice', 'from_number', fallback='')
-                VOICE_DESTINATION_NUMBERS = [num.strip() for num in self.config.get('Voice', 'destination_number', fallback='').split(',') if num.strip()]
-
-                # Retrieve Twilio WhatsApp configuration
-                WHATSAPP_ENABLED = self.config.getboolean('WhatsApp', 'enabled', fallback=False)
-                WHATSAPP_ACCOUNT_SID = self.config.get('WhatsApp', 'account_sid', fallback='')
-                WHATSAPP_AUTH_TOKEN = self.config.get('WhatsApp', 'auth_token', fallback='')
-                WHATSAPP_FROM_NUMBER = self.config.get('WhatsApp', 'from_number', fallback='')
-                WHATSAPP_TO_NUMBERS = [num.strip() for num in self.config.get('WhatsApp', 'to_number', fallback='').split(',') if num.strip()]
-
-                # Retrieve Slack configuration
-                SLACK_ENABLED = self.config.getboolean('Slack', 'enabled', fallback=False)
-                SLACK_TOKEN = self.config.get('Slack', 'token', fallback='')
-                SLACK_CHANNEL = self.config.get('Slack', 'channel', fallback='')
-
-                # Retrieve Telegram configuration
-                TELEGRAM_ENABLED = self.config.getboolean('Telegram', 'enabled', fallback=False)
-                TELEGRAM_BOT_TOKEN = self.config.get('Telegram', 'bot_token', fallback='')
-                TELEGRAM_CHAT_ID = self.config.get('Telegram', 'chat_id', fallback='')
-
-                # Retrieve Discord configuration
-                DISCORD_ENABLED = self.config.getboolean('Discord', 'enabled', fallback=False)
-                DISCORD_WEBHOOK_URL = self.config.get('Discord', 'webhook_url', fallback='')
-
-                # Retrieve Custom Webhook configuration
-                CUSTOM_WEBHOOK_ENABLED = self.config.getboolean('CustomWebhook', 'enabled', fallback=False)
-                CUSTOM_WEBHOOK_URL = self.config.get('CustomWebhook', 'webhook_url', fallback='')
-
-                # Connect to the IMAP server
-                imap = connect_to_imap(IMAP_SERVER, IMAP_PORT, EMAIL_USERNAME, EMAIL_PASSWORD)
+                # Pick up config.ini changes without re-reading every value on each iteration
+                settings = self.refresh_settings()
+
+                # There is no point in checking the inbox when no notification could be sent
+                if not settings.any_channel_enabled:
+                    log.warning("No notification method is enabled. Checking again in %s seconds...", settings.check_interval)
+                    self.stop_event.wait(settings.check_interval)
+                    continue
+
+                # Connect to the IMAP server, reusing the connection across iterations
+                imap = self.ensure_connected(settings)
                 if not imap:
-                    logging.warning(f"Failed to connect to IMAP server. Retrying in {CHECK_INTERVAL} seconds...")
-                    time.sleep(CHECK_INTERVAL)
+                    # Back off while the server stays unreachable instead of retrying on a fixed interval
+                    connect_failures += 1
+                    delay = reconnect_delay(connect_failures, settings.check_interval)
+                    log.warning("Failed to connect to IMAP server. Retrying in %.0f seconds...", delay)
+                    self.stop_event.wait(delay)
                     continue
+                connect_failures = 0
 
                 # Fetch unread emails
                 unread_emails = fetch_unread_emails(imap)
-                logging.info(f"Found {len(unread_emails)} unread email(s).")
-
-                # Process each unread email
-                for email_id, msg in unread_emails:
-                    # Extract the sender's email address
-                    sender = msg.get("From")
-                    if sender:
-                        sender_email = email.utils.parseaddr(sender)[1].lower()
-                    else:
-                        sender_email = ""
-
-                    # Apply Email Filtering
-                    if FILTER_EMAILS:
-                        match = False
-                        for filter_entry in FILTER_EMAILS:
-                            if filter_entry.startswith('@'):
-                                # Domain filter
-                                domain = filter_entry[1:]
-                                if sender_email.endswith(f"@{domain}"):
-                                    match = True
-                                    break
-                            else:
-                                # Specific email address filter
-                                if sender_email == filter_entry:
-                                    match = True
-                                    break
-                        if not match:
-                            logging.info(f"Email from {sender_email} does not match filter criteria. Skipping.")
-                            continue  # Skip to the next email
-
-                    # Extract the subject and body from the email
-                    # Decode the subject if necessary
-                    subject, encoding = decode_header(msg.get("Subject"))[0]
-                    if isinstance(subject, bytes):
-                        subject = subject.decode(encoding if encoding else "utf-8", errors='ignore')
-
-                    # Extract the body of the email
-                    body = extract_email_body(msg)
-                    logging.info(f"Processing email from {sender_email} with subject: {subject}")
-
-                    # Flag to track if any notification was sent successfully
-                    success = False
+                log.info("Found %s unread email(s).", len(unread_emails))
+
+                # Apply Email Filtering on the headers, so bodies are only downloaded for matching emails
+                matching_emails = []
+                for email_id, msg, text_part in unread_emails:
+                    # Extract the sender's email address; a malformed header only skips its own email
+                    try:
+                        sender_email = parse_sender(header_text(msg.get("From")))
+                    except Exception as e:
+                        log.error("Failed to parse the sender of email %s: %s", email_id.decode(), e)
+                        continue
+
+                    if not settings.matches_filter(sender_email):
+                        log.info("Email from %s does not match filter criteria. Skipping.", sender_email)
+                        continue  # Skip to the next email
+                    matching_emails.append((email_id, msg, sender_email, text_part))
+
+                bodies = fetch_email_bodies(imap, [(email_id, text_part) for email_id, _, _, text_part in matching_emails],
+                                            settings.body_fetch_limit)
 
-                    # Construct the message for notifications
-                    notification_message = f"{subject}: {body}"
-
-                    # Send SMS via Twilio if enabled
-                    if TWILIO_SMS_ENABLED:
-                        sms_body = (notification_message[:MAX_SMS_LENGTH] + '...') if len(notification_message) > MAX_SMS_LENGTH else notification_message
-                        for to_number in TWILIO_SMS_DESTINATION_NUMBERS:
-                            sms_sid = send_sms_via_twilio(
-                                account_sid=TWILIO_SMS_ACCOUNT_SID,
-                                auth_token=TWILIO_SMS_AUTH_TOKEN,
-                                from_number=TWILIO_SMS_FROM_NUMBER,
-                                to_number=to_number,
-                                body=sms_body
-                            )
-                            if sms_sid:
-                                success = True
-
-                    # Make Voice Call via Twilio if enabled
-                    if VOICE_ENABLED:
-                        for to_number in VOICE_DESTINATION_NUMBERS:
-                            call_sid = make_voice_call(
-                                account_sid=VOICE_ACCOUNT_SID,
-                                auth_token=VOICE_AUTH_TOKEN,
-                                from_number=VOICE_FROM_NUMBER,
-                                to_number=to_number,
-                                message=notification_message
-                            )
-                            if call_sid:
-                                success = True
-
-                    # Send WhatsApp message via Twilio if enabled
-                    if WHATSAPP_ENABLED:
-                        for to_number in WHATSAPP_TO_NUMBERS:
-                            message_sid = send_whatsapp_message(
-                                account_sid=WHATSAPP_ACCOUNT_SID,
-                                auth_token=WHATSAPP_AUTH_TOKEN,
-                                from_number=WHATSAPP_FROM_NUMBER,
-                                to_number=to_number,
-                                body=notification_message
-                            )
-                            if message_sid:
-                                success = True
-
-                    # Send Slack message if enabled
-                    if SLACK_ENABLED:
-                        slack_ts = send_slack_message(
-                            token=SLACK_TOKEN,
-                            channel=SLACK_CHANNEL,
-                            subject=subject,
-                            body=body
-                        )
-                        if slack_ts:
-                            success = True
-
-                    # Send Telegram message if enabled
-                    if TELEGRAM_ENABLED:
-                        telegram_success = send_telegram_message(
-                            bot_token=TELEGRAM_BOT_TOKEN,
-                            chat_id=TELEGRAM_CHAT_ID,
-                            subject=subject,
-                            body=body
-                        )
-                        if telegram_success:
-                            success = True
-
-                    # Send Discord message if enabled
-                    if DISCORD_ENABLED:
-                        discord_success = send_discord_message(
-                            webhook_url=DISCORD_WEBHOOK_URL,
-                            subject=subject,
-                            body=body
-                        )
-                        if discord_success:
-                            success = True
-
-                    # Send Custom Webhook if enabled
-                    if CUSTOM_WEBHOOK_ENABLED:
-                        payload = {
-                            'subject': subject,
-                            'body': body
-                        }
-                        custom_webhook_success = send_custom_webhook(
-                            webhook_url=CUSTOM_WEBHOOK_URL,
-                            payload=payload
-                        )
-                        if custom_webhook_success:
-                            success = True
+                # Process each matching email
+                successful_ids = []
+                for email_id, msg, sender_email, text_part in matching_emails:
+                    body = bodies.get(email_id, "")
+
+                    # Extract the subject from the email, decoding RFC 2047 encoded words
+                    subject = decode_subject(header_text(msg.get("Subject")))
+
+                    log.info("Processing email from %s with subject: %s", sender_email, subject)
+
+                    # Fill in the email content for every enabled notification destination
+                    content = notification_content(subject, body, settings.max_sms_length)
+                    tasks = [
+                        (channel.func, {**channel.kwargs, **content[channel.content]})
+                        for channel in settings.channels
+                    ]
+
+                    # The notifications are independent network calls, so send them concurrently
+                    # and track if any notification was sent successfully
+                    success = False
+                    futures = [self._executor.submit(func, **kwargs) for func, kwargs in tasks]
+                    try:
+                        for future in concurrent.futures.as_completed(futures, timeout=NOTIFICATION_TIMEOUT):
+                            try:
+                                if future.result():
+                                    success = True
+                            except Exception as e:
+                                # One failing sender must not abort the others or the cycle
+                                log.error("Notification for email %s failed: %s", email_id.decode(), e)
+                    except concurrent.futures.TimeoutError:
+                        log.warning("Some notifications for email %s did not finish within %s seconds.", email_id.decode(), NOTIFICATION_TIMEOUT)
 
                     # Mark the email as read if any notification was sent successfully
                     if success:
-                        if mark_as_read(imap, email_id):
-                            pass  # Already logged inside mark_as_read
-                        else:
-                            logging.warning(f"Failed to mark email {email_id.decode()} as read.")
+                        successful_ids.append(email_id)
                     else:
-                        logging.info(f"No successful notifications sent for email {email_id.decode()}.")
-
+                        log.info("No successful notifications sent for email %s.", email_id.decode())
+
+                # Flag all notified emails in one round-trip
+                if successful_ids and not mark_as_read(imap, successful_ids):
+                    log.warning("Failed to mark %s email(s) as read.", len(successful_ids))
+
+                if self.stop_event.is_set():
+                    break
+
+                # Wait for the server to push new mail instead of polling on a fixed interval;
+                # the check interval still bounds the wait so unsent emails are retried
+                if 'IDLE' in imap.capabilities:
+                    log.info("Waiting for new emails (IMAP IDLE).")
+                    idle_wait(imap, min(IDLE_TIMEOUT, settings.check_interval), self._wakeup_r)
+                else:
+                    log.info("Server does not support IDLE. Checking again within %s seconds.", settings.check_interval)
+                    noop_wait(imap, settings.check_interval, self.stop_event)
+
+            except (imaplib.IMAP4.abort, OSError) as e:
+                # Only a dropped connection requires a new login
+                log.warning("IMAP connection lost: %s. Reconnecting...", e)
+                self.disconnect_imap(logout=False)
             except Exception as e:
-                logging.error(f"An error occurred during email monitoring: {e}")
-            finally:
-                # Ensure the IMAP connection is properly closed
-                if imap:
-                    try:
-                        imap.logout()
-                        logging.info("Logged out from IMAP server.")
-                    except Exception as e:
-                        logging.error(f"Error while logging out from IMAP: {e}")
-                # Wait before checking for new emails again based on check interval
-                if not self.stop_event.is_set():
-                    logging.info(f"Waiting for {CHECK_INTERVAL} seconds before the next check.")
-                    time.sleep(CHECK_INTERVAL)
+                log.error("An error occurred during email monitoring: %s", e)
+                # Wait before retrying, but return immediately when monitoring is stopped
+                self.stop_event.wait(self.settings.check_interval)
 
-
-def signal_handler(sig, frame, app):
-    """
-    Handle termination signals to gracefully shut down the application.
-
-    Args:
-        sig (int): Signal number.
-        frame (object): Current stack frame.
-        app (EmailMonitorApp): Instance of the EmailMonitorApp.
-    """
-    logging.info(f"Received signal {sig}. Shutting down gracefully...")
-    app.stop()
-    sys.exit(0)
+        # Log out once monitoring stops
+        self.disconnect_imap()
 
 
 def main():
@@ -812,24 +1879,21 @@ def main():
     # Load configuration
     config = load_config()
 
+    # Pin the process and lower its priority if configured, before any threads are started
+    apply_process_settings(config)
+
     # Initialize the application
     app = EmailMonitorApp(config)
 
     # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, lambda sig, frame: signal_handler(sig, frame, app))
-    signal.signal(signal.SIGTERM, lambda sig, frame: signal_handler(sig, frame, app))
-
-    # Start monitoring
-    app.start()
+    app.install_signal_handlers()
 
-    # Keep the main thread alive while monitoring is active
+    # Monitor on the main thread until a signal stops the loop
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logging.info("KeyboardInterrupt received. Exiting...")
-        app.stop()
-        sys.exit(0)
+        app.run_forever()
+    finally:
+        # Flush and close the log handlers before the interpreter exits
+        logging.shutdown()
 
 
 if __name__ == '__main__':
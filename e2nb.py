@@ -15,29 +15,209 @@ Date: Dec 2024
 """
 
 import imaplib
-import email
+import concurrent.futures
+import collections
+import functools
+import hashlib
+import heapq
+import select
+import socket
+import ssl
+import random
 import time
 import threading
+import logging
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 from tkinter import scrolledtext
 from tkinter import Menu
 import tkinter.font as tkFont
+from email import policy as email_policy
 from email.header import decode_header
+from email.message import EmailMessage
+from email.parser import BytesHeaderParser
+from email.utils import parseaddr
+from html.parser import HTMLParser
 import configparser  # For reading and writing configuration files
+import io
+import json
 import os  # For checking if the config file exists
+import shutil
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from datetime import datetime
 
 # Optional imports for notification services
 from twilio.rest import Client  # For SMS, Voice Call, WhatsApp
+from twilio.http.http_client import TwilioHttpClient
+from twilio.twiml.voice_response import VoiceResponse
 from slack_sdk import WebClient  # For Slack notifications
 from slack_sdk.errors import SlackApiError
 import requests  # For Telegram, Discord, and Custom Webhooks
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster JSON encoding of webhook payloads
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
 
 # Set the path for the configuration file
 CONFIG_FILE_PATH = 'config.ini'
 
+# IMAP IDLE settings (RFC 2177): re-issue IDLE before the server's 30-minute inactivity timeout
+IDLE_TAG = b'E2NB'
+IDLE_TIMEOUT = 28 * 60
+# Keep-alive interval for servers that do not advertise IDLE
+NOOP_INTERVAL = 28
+# Seconds a blocking IMAP read may stall before the connection is treated as lost, which
+# also bounds how long a stopped monitor thread can keep running
+IMAP_TIMEOUT = 30
+
+# Maximum number of unread emails processed per check (the most recent ones)
+MAX_EMAILS_PER_CHECK = 5
+
+# Maximum number of bytes of the plain text body fetched per email
+BODY_FETCH_LIMIT = 65536
+
+# Worker threads used to send the notifications for an email concurrently, and the
+# number of seconds to wait for them before moving on
+NOTIFICATION_WORKERS = 8
+NOTIFICATION_TIMEOUT = 60
+
+# Upper bound in seconds for the growing delay between failed IMAP connection attempts
+RECONNECT_MAX_DELAY = 5 * 60
+
+# Notifications already sent are remembered for SEEN_TTL seconds (at most SEEN_CAPACITY of
+# them) so an email that is fetched again is not sent twice
+SEEN_CAPACITY = 512
+SEEN_TTL = 2 * 60 * 60
+
+# Maximum number of notifications sent per notification method (and per minute), so a
+# burst of emails cannot trip the providers' own rate limits
+RATE_LIMIT_PER_MINUTE = 10
+
+# Number of lines kept in the Logs tab, and the delay in milliseconds used to batch
+# log messages into a single widget update
+LOG_MAX_LINES = 2000
+LOG_FLUSH_INTERVAL = 200
+
+# Twilio clients keyed by (account_sid, auth_token), reused so their HTTP connections stay alive
+_TWILIO_CLIENTS = {}
+_TWILIO_CLIENTS_LOCK = threading.Lock()
+
+# Slack clients keyed by token, reused for the same reason
+_SLACK_CLIENTS = {}
+_SLACK_CLIENTS_LOCK = threading.Lock()
+
+# Entry fields of the configuration tabs, keyed by the tab's frame name. Each field is
+# (config section, config key, widget attribute, label, width, masked, default), followed
+# by an optional hint shown below the fields. These tables drive both building the tabs
+# and copying their values back into the configuration.
+ENTRY_TABS = {
+    'email_frame': ((
+        ('Email', 'imap_server', 'imap_server_entry', "IMAP Server:", 30, False, ''),
+        ('Email', 'imap_port', 'imap_port_entry', "Port:", 10, False, '993'),
+        ('Email', 'username', 'username_entry', "Username:", 30, False, ''),
+        ('Email', 'password', 'password_entry', "Password:", 30, True, ''),
+        ('Email', 'filter_emails', 'filter_emails_entry', "Filter Emails (@domain or email):", 50, False, ''),
+    ), "(Separate multiple entries with commas)"),
+    'settings_frame': ((
+        ('Settings', 'max_sms_length', 'max_sms_length_entry', "Max SMS Length:", 10, False, '1600'),
+        ('Settings', 'check_interval', 'check_interval_entry', "Check Interval (seconds):", 10, False, '60'),
+    ), None),
+    'twilio_sms_frame': ((
+        ('Twilio', 'account_sid', 'twilio_sms_sid_entry', "Account SID:", 30, False, ''),
+        ('Twilio', 'auth_token', 'twilio_sms_token_entry', "Auth Token:", 30, True, ''),
+        ('Twilio', 'from_number', 'twilio_sms_from_entry', "From Number:", 30, False, ''),
+        ('Twilio', 'destination_number', 'twilio_sms_to_entry', "Destination Number(s):", 30, False, ''),
+    ), "(Separate multiple numbers with commas)"),
+    'twilio_voice_frame': ((
+        ('Voice', 'account_sid', 'twilio_voice_sid_entry', "Account SID:", 30, False, ''),
+        ('Voice', 'auth_token', 'twilio_voice_token_entry', "Auth Token:", 30, True, ''),
+        ('Voice', 'from_number', 'twilio_voice_from_entry', "From Number:", 30, False, ''),
+        ('Voice', 'destination_number', 'twilio_voice_to_entry', "Destination Number(s):", 30, False, ''),
+    ), "(Separate multiple numbers with commas)"),
+    'twilio_whatsapp_frame': ((
+        ('WhatsApp', 'account_sid', 'twilio_whatsapp_sid_entry', "Account SID:", 30, False, ''),
+        ('WhatsApp', 'auth_token', 'twilio_whatsapp_token_entry', "Auth Token:", 30, True, ''),
+        ('WhatsApp', 'from_number', 'twilio_whatsapp_from_entry', "From Number:", 30, False, ''),
+        ('WhatsApp', 'to_number', 'twilio_whatsapp_to_entry', "To Number(s):", 30, False, ''),
+    ), "(Separate multiple numbers with commas)"),
+    'slack_frame': ((
+        ('Slack', 'token', 'slack_token_entry', "Slack Token:", 50, True, ''),
+        ('Slack', 'channel', 'slack_channel_entry', "Channel Name:", 30, False, ''),
+    ), None),
+    'telegram_frame': ((
+        ('Telegram', 'bot_token', 'telegram_bot_token_entry', "Bot Token:", 50, True, ''),
+        ('Telegram', 'chat_id', 'telegram_chat_id_entry', "Chat ID:", 30, False, ''),
+    ), None),
+    'discord_frame': ((
+        ('Discord', 'webhook_url', 'discord_webhook_entry', "Webhook URL:", 70, False, ''),
+    ), None),
+    'custom_webhook_frame': ((
+        ('CustomWebhook', 'webhook_url', 'custom_webhook_entry', "Webhook URL:", 70, False, ''),
+    ), None),
+}
+
+# Config section of each notification method and the attribute of its enable checkbox
+ENABLED_VARS = (
+    ('Twilio', 'twilio_sms_var'),
+    ('Voice', 'voice_var'),
+    ('WhatsApp', 'whatsapp_var'),
+    ('Slack', 'slack_var'),
+    ('Telegram', 'telegram_var'),
+    ('Discord', 'discord_var'),
+    ('CustomWebhook', 'custom_webhook_var'),
+)
+
+# (connect, read) timeout in seconds for outgoing HTTP requests
+HTTP_TIMEOUT = (5, 10)
+
+# Shared HTTP session for Telegram, Discord and custom webhooks (keep-alive connection pooling).
+# Transient failures are retried briefly; the final response is returned rather than raised
+# so its status code gets logged.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.headers.update({'User-Agent': 'e2nb/0.1'})
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=NOTIFICATION_WORKERS,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+))
+
+# Translation tables that backslash-escape the characters with a special meaning in
+# Telegram MarkdownV2 and Discord markdown, so subjects and bodies are sent verbatim
+_TELEGRAM_ESCAPE = str.maketrans({char: '\\' + char for char in '\\_*[]()~`>#+-=|{}.!'})
+_DISCORD_ESCAPE = str.maketrans({char: '\\' + char for char in '\\*_~`|>'})
+
+# The Discord payload always has the same shape, so only the content string is encoded per message
+_DISCORD_TEMPLATE = b'{"content": %s}'
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def encode_json(value):
+    """
+    Serialize a value to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        value: The JSON-serializable value.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
 
 def load_config(config_file=CONFIG_FILE_PATH):
     """
@@ -64,9 +244,30 @@ def save_config(config, config_file=CONFIG_FILE_PATH):
     Args:
         config (configparser.ConfigParser): The configuration data to save.
         config_file (str): The path to the configuration INI file.
+
+    The file is only rewritten when its content changes, and it is replaced atomically so
+    an interrupted save never leaves a truncated config.ini behind.
     """
-    with open(config_file, 'w') as file:
-        config.write(file)
+    buffer = io.StringIO()
+    config.write(buffer)
+    data = buffer.getvalue()
+    try:
+        with open(config_file) as file:
+            if file.read() == data:
+                return
+    except OSError:
+        pass
+
+    temp_file = f"{config_file}.tmp"
+    with open(temp_file, 'w') as file:
+        file.write(data)
+        # Make sure the data is on disk before the rename makes it the live config
+        file.flush()
+        os.fsync(file.fileno())
+    # Keep the permissions of the existing file, which may hold credentials
+    if os.path.exists(config_file):
+        shutil.copymode(config_file, temp_file)
+    os.replace(temp_file, config_file)
 
 
 def create_default_config(config_file=CONFIG_FILE_PATH):
@@ -157,107 +358,692 @@ def connect_to_imap(server, port, username, password):
         imaplib.IMAP4_SSL: An authenticated IMAP connection object.
     """
     try:
-        imap = imaplib.IMAP4_SSL(server, port)
+        imap = imaplib.IMAP4_SSL(server, port, timeout=IMAP_TIMEOUT)
         imap.login(username, password)
+        # Servers often advertise extensions such as IDLE only after authentication
+        typ, data = imap.capability()
+        if typ == 'OK':
+            imap.capabilities = tuple(data[-1].upper().decode().split())
         return imap
     except Exception as e:
-        print(f"Failed to connect to IMAP server {server}:{port}: {e}")
+        log.error("Failed to connect to IMAP server %s:%s: %s", server, port, e)
         return None
 
 
+@dataclass(slots=True)
+class ParsedEmail:
+    """
+    An unread email with its headers decoded and its plain text body extracted.
+    """
+    email_id: bytes
+    message_id: str
+    sender: str
+    subject: str
+    body: str
+
+
 def fetch_unread_emails(imap):
     """
     Retrieve unread emails from the inbox.
 
     Args:
-        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection object.
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with the inbox selected.
+
+    Only the From/Subject headers and the first plain text part (or HTML part, for
+    messages without one) are downloaded.
 
     Returns:
-        list: A list of tuples containing email IDs and email message objects.
+        list: A list of ParsedEmail objects, most recent first.
     """
     try:
-        imap.select("inbox")  # Select the inbox folder
-        status, messages = imap.search(None, 'UNSEEN')  # Search for unread messages
+        # Work with UIDs so the IDs stay valid even if messages are expunged meanwhile
+        status, messages = imap.uid('SEARCH', None, 'UNSEEN')  # Search for unread messages
         if status != "OK":
-            print("No unread emails found.")
+            log.debug("No unread emails found.")
             return []
 
-        email_ids = messages[0].split()  # Get a list of email IDs
+        # Select the most recent email UIDs (highest first) without sorting the whole list
+        email_ids = heapq.nlargest(MAX_EMAILS_PER_CHECK, messages[0].split(), key=int)
         if not email_ids:
-            print("No unread emails found.")
+            log.debug("No unread emails found.")
             return []
 
-        # Convert email IDs to integers and sort in descending order (most recent first)
-        email_ids = [int(eid) for eid in email_ids]
-        email_ids.sort(reverse=True)
-        # Take the 5 most recent email IDs
-        email_ids = email_ids[:5]
-        # Convert email IDs back to strings and encode to bytes
-        email_ids = [str(eid).encode() for eid in email_ids]
+        # Fetch the headers we need and the MIME structure of all messages in one round-trip,
+        # without downloading attachments
+        uid_set = b",".join(email_ids)
+        res, data = imap.uid('FETCH', uid_set, "(UID BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS (FROM SUBJECT MESSAGE-ID)])")
+        fetched = {}
+        for items in parse_fetch_response(data).values():
+            if b'UID' in items and b'BODYSTRUCTURE' in items:
+                fetched[str(items[b'UID']).encode()] = items
+
+        # Group the messages by the section of their body part, so the bodies
+        # are fetched with one command per distinct section (usually just one)
+        sections = {}
+        text_parts = {}
+        for uid, items in fetched.items():
+            text_part = find_body_part(items[b'BODYSTRUCTURE'] or [])
+            if text_part:
+                text_parts[uid] = text_part
+                sections.setdefault(text_part[0], []).append(uid)
+
+        # BODY.PEEK leaves the \Seen flag untouched
+        payloads = {}
+        for section, uids in sections.items():
+            res, data = imap.uid('FETCH', b",".join(uids), f"(UID BODY.PEEK[{section}]<0.{BODY_FETCH_LIMIT}>)")
+            for items in parse_fetch_response(data).values():
+                payload = get_fetch_item(items, f"BODY[{section}]".encode())
+                if b'UID' in items and payload:
+                    payloads[str(items[b'UID']).encode()] = payload
 
         emails = []
         for email_id in email_ids:
-            res, msg = imap.fetch(email_id, "(RFC822)")
-            for response in msg:
-                if isinstance(response, tuple):
-                    # Parse the email message from bytes
-                    msg = email.message_from_bytes(response[1])
-                    emails.append((email_id, msg))  # Append the email ID and message object to the list
+            items = fetched.get(email_id)
+            if items is None:
+                continue
+            # A malformed message is skipped on its own instead of discarding the batch
+            try:
+                msg = BytesHeaderParser().parsebytes(get_fetch_item(items, b'BODY[HEADER') or b'')
+                body = ""
+                if email_id in payloads:
+                    section, encoding, charset, subtype = text_parts[email_id]
+                    body = extract_email_body(payloads[email_id], encoding, charset)
+                    if subtype == 'html':
+                        body = html_to_text(body)
+                # Decode the headers once here so nothing downstream has to
+                emails.append(ParsedEmail(
+                    email_id=email_id,
+                    message_id=(header_text(msg.get("Message-ID")) or "").strip(),
+                    sender=parse_sender(header_text(msg.get("From"))),
+                    subject=decode_subject(header_text(msg.get("Subject"))),
+                    body=body
+                ))
+            except Exception as e:
+                log.error("Failed to parse email %s: %s", email_id.decode(), e)
         return emails
     except Exception as e:
-        print(f"Failed to fetch emails: {e}")
+        log.error("Failed to fetch emails: %s", e)
         return []
 
 
-def extract_email_body(msg):
+def parse_imap_response(data):
     """
-    Extract the plain text body from an email message object.
+    Parse raw response data returned by imaplib into nested Python lists.
+
+    Parenthesized lists become lists, NIL becomes None, numbers become ints and
+    quoted strings, literals and other atoms become bytes.
 
     Args:
-        msg (email.message.EmailMessage): The email message object.
+        data (list): Response data as returned by imaplib (bytes lines and literal tuples).
 
     Returns:
-        str: The plain text body of the email.
+        list: The parsed top-level values.
     """
-    try:
-        if msg.is_multipart():
-            # The email is multipart, so we need to iterate over its parts
-            for part in msg.walk():
-                # Check if the part is plain text and not an attachment
-                if part.get_content_type() == "text/plain" and not part.get("Content-Disposition"):
-                    # Decode the content from bytes to string using UTF-8 encoding
-                    return part.get_payload(decode=True).decode("utf-8")
-            # If no plain text part is found, return an empty string
-            return ""
+    # Reassemble the response stream; imaplib splits literals out into (line, literal) tuples
+    stream = b''.join(
+        item[0] + b'\r\n' + item[1] if isinstance(item, tuple) else item + b'\r\n'
+        for item in data if item is not None
+    )
+    stack = [[]]
+    pos = 0
+    length = len(stream)
+    while pos < length:
+        char = stream[pos:pos + 1]
+        if char in (b' ', b'\r', b'\n'):
+            pos += 1
+        elif char == b'(':
+            stack.append([])
+            pos += 1
+        elif char == b')':
+            values = stack.pop()
+            stack[-1].append(values)
+            pos += 1
+        elif char == b'"':
+            # Quoted string with backslash escapes
+            value = bytearray()
+            pos += 1
+            while pos < length and stream[pos:pos + 1] != b'"':
+                if stream[pos:pos + 1] == b'\\':
+                    pos += 1
+                value += stream[pos:pos + 1]
+                pos += 1
+            stack[-1].append(bytes(value))
+            pos += 1
+        elif char == b'{':
+            # Literal: {size} followed by CRLF and exactly size bytes
+            end = stream.index(b'}', pos)
+            size = int(stream[pos + 1:end])
+            start = end + 3
+            stack[-1].append(stream[start:start + size])
+            pos = start + size
         else:
-            # The email is not multipart; decode the payload directly
-            return msg.get_payload(decode=True).decode("utf-8")
+            # Atom; section specifiers such as BODY[HEADER.FIELDS (FROM)] may contain spaces
+            start = pos
+            while pos < length and stream[pos:pos + 1] not in (b' ', b'(', b')', b'\r', b'\n'):
+                if stream[pos:pos + 1] == b'[':
+                    pos = stream.index(b']', pos)
+                pos += 1
+            atom = stream[start:pos]
+            if atom.upper() == b'NIL':
+                stack[-1].append(None)
+            elif atom.isdigit():
+                stack[-1].append(int(atom))
+            else:
+                stack[-1].append(atom)
+    return stack[0]
+
+
+def parse_fetch_response(data):
+    """
+    Parse the response data of an IMAP FETCH command.
+
+    Args:
+        data (list): Response data as returned by imaplib's fetch().
+
+    Returns:
+        dict: Message number mapped to a dict of upper-cased FETCH item names and their values.
+    """
+    parsed = parse_imap_response(data)
+    messages = {}
+    for msg_num, items in zip(parsed[::2], parsed[1::2]):
+        if isinstance(items, list):
+            messages[msg_num] = {
+                name.upper() if isinstance(name, bytes) else name: value
+                for name, value in zip(items[::2], items[1::2])
+            }
+    return messages
+
+
+def get_fetch_item(items, prefix):
+    """
+    Look up a FETCH item whose name starts with the given prefix.
+
+    Servers may echo section specifiers such as HEADER.FIELDS differently, so items
+    are matched by prefix rather than by exact name.
+
+    Args:
+        items (dict): FETCH items of a single message, as returned by parse_fetch_response().
+        prefix (bytes): Upper-case prefix of the item name, e.g. b'BODY[HEADER'.
+
+    Returns:
+        The item value, or None if the message has no such item.
+    """
+    for name, value in items.items():
+        if isinstance(name, bytes) and name.startswith(prefix):
+            return value
+    return None
+
+
+def find_text_part(structure, section='', subtype=b'plain'):
+    """
+    Locate the first text part of a message with the given subtype that is not an attachment.
+
+    Args:
+        structure (list): A parsed BODYSTRUCTURE (or a nested part of one).
+        section (str): The IMAP section number of the structure ('' for the whole message).
+        subtype (bytes): The lower-cased text subtype to look for, e.g. b'plain' or b'html'.
+
+    Returns:
+        tuple: (section, content transfer encoding, charset, subtype) of the part, or None if there is none.
+    """
+    if not structure:
+        return None
+
+    if isinstance(structure[0], list):
+        # Multipart: the child parts come first, followed by the multipart subtype
+        for index, part in enumerate(structure, 1):
+            if not isinstance(part, list):
+                break
+            found = find_text_part(part, f"{section}.{index}" if section else str(index), subtype)
+            if found:
+                return found
+        return None
+
+    maintype = (structure[0] or b'').lower()
+    part_subtype = (structure[1] or b'').lower()
+    # A single-part message is used as-is as long as it is text
+    if maintype != b'text' or (section and part_subtype != subtype):
+        return None
+
+    # For text parts the disposition follows type, subtype, params, id, description,
+    # encoding, size, line count and MD5
+    disposition = structure[9] if len(structure) > 9 else None
+    if isinstance(disposition, list) and disposition and (disposition[0] or b'').lower() == b'attachment':
+        return None
+
+    params = structure[2] if isinstance(structure[2], list) else []
+    charset = None
+    for name, value in zip(params[::2], params[1::2]):
+        if isinstance(name, bytes) and name.lower() == b'charset' and value:
+            charset = value.decode('ascii', errors='ignore')
+    return (
+        section or '1',
+        (structure[5] or b'7bit').decode('ascii', errors='ignore').lower(),
+        charset,
+        part_subtype.decode('ascii', errors='ignore')
+    )
+
+
+def find_body_part(structure):
+    """
+    Locate the part of a message to use as its body: the first plain text part, or the
+    first HTML part for messages that have no plain text alternative.
+
+    Args:
+        structure (list): A parsed BODYSTRUCTURE.
+
+    Returns:
+        tuple: (section, content transfer encoding, charset, subtype) of the part, or None if there is none.
+    """
+    return find_text_part(structure) or find_text_part(structure, subtype=b'html')
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Collect the visible text of an HTML document, with line breaks at block elements.
+    """
+
+    BLOCK_TAGS = frozenset({
+        'blockquote', 'br', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'li', 'p', 'table', 'tr'
+    })
+    HIDDEN_TAGS = frozenset({'head', 'script', 'style', 'title'})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.hidden_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HIDDEN_TAGS:
+            self.hidden_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.HIDDEN_TAGS:
+            self.hidden_depth = max(0, self.hidden_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self.hidden_depth:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    """
+    Convert an HTML body, possibly truncated, into plain text.
+
+    Args:
+        html (str): The HTML markup.
+
+    Returns:
+        str: The visible text, with whitespace collapsed and blank lines removed.
+    """
+    parser = HTMLTextExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
     except Exception as e:
-        print(f"Failed to extract email body: {e}")
+        log.error("Failed to convert HTML body to text: %s", e)
+    lines = (' '.join(line.split()) for line in ''.join(parser.parts).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def header_text(value):
+    """
+    Convert a header value from the compat32 header parser into a plain string.
+
+    Headers with undeclared 8-bit bytes (usually raw UTF-8) come back as unhashable
+    email.header.Header objects; their bytes are decoded as UTF-8 here, falling back
+    to Latin-1.
+
+    Args:
+        value (str or email.header.Header): The header value, or None.
+
+    Returns:
+        str: The header text, or None if there is none.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    parts = []
+    for part, charset in decode_header(value):
+        if isinstance(part, str):
+            parts.append(part)
+            continue
+        try:
+            parts.append(part.decode('utf-8' if charset in (None, 'unknown-8bit') else charset))
+        except (LookupError, UnicodeDecodeError):
+            parts.append(part.decode('latin-1'))
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_sender(raw_sender):
+    """
+    Extract the lower-cased email address from a raw From header.
+
+    Results are cached since the same senders keep coming back.
+
+    Args:
+        raw_sender (str): The raw header value, or None.
+
+    Returns:
+        str: The sender's address, or an empty string if there is none.
+    """
+    if not raw_sender:
         return ""
+    return parseaddr(raw_sender)[1].lower()
 
 
-def mark_as_read(imap, email_id):
+@functools.lru_cache(maxsize=256)
+def decode_subject(raw_subject):
     """
-    Mark an email as read on the IMAP server using the email ID.
+    Decode a raw Subject header, including RFC 2047 encoded words, into text.
+
+    Results are cached since replies in a thread repeat the same encoded subject.
+
+    Args:
+        raw_subject (str): The raw header value, possibly folded, or None.
+
+    Returns:
+        str: The decoded subject, or an empty string if there is none.
+    """
+    if not raw_subject:
+        return ""
+    # Unfold the header before handing it to the modern header registry
+    return str(email_policy.default.header_factory('subject', ''.join(raw_subject.splitlines())))
+
+
+def trim_base64(payload):
+    """
+    Cut a base64 payload back to its last complete 4-character group.
+
+    A partial fetch can end in the middle of a group, and a leftover single character
+    makes the email package give up and return the encoded text as-is.
+
+    Args:
+        payload (bytes): The raw, possibly truncated, base64 data.
+
+    Returns:
+        bytes: The payload without the trailing incomplete group.
+    """
+    excess = len(payload.translate(None, b' \t\r\n')) % 4
+    end = len(payload)
+    while excess:
+        end -= 1
+        if payload[end] not in b' \t\r\n':
+            excess -= 1
+    return payload[:end]
+
+
+def extract_email_body(payload, encoding, charset):
+    """
+    Decode the fetched plain text part of an email into text.
+
+    Args:
+        payload (bytes): The raw, possibly truncated, body part.
+        encoding (str): The part's content transfer encoding (e.g. 'base64', 'quoted-printable').
+        charset (str): The part's character set, or None for UTF-8.
+
+    Returns:
+        str: The decoded text.
+    """
+    try:
+        # Wrap the part in a message so the email package handles transfer encoding and charset
+        part = EmailMessage()
+        part['Content-Type'] = 'text/plain'
+        part.set_param('charset', charset or 'utf-8')
+        part['Content-Transfer-Encoding'] = encoding
+        if encoding == 'base64':
+            payload = trim_base64(payload)
+        part.set_payload(payload.decode('ascii', 'surrogateescape'))
+        try:
+            return part.get_content(errors='ignore')
+        except LookupError:
+            # Unknown charset
+            return part.get_payload(decode=True).decode('utf-8', errors='ignore')
+    except Exception as e:
+        log.error("Failed to extract email body: %s", e)
+        return ""
+
+
+def read_ahead(imap):
+    """
+    Take the response data imaplib has already read into its buffer, without blocking.
+
+    imaplib reads from the socket through a buffered file, which can hold responses that
+    arrived right after the last tagged reply; select() on the socket cannot see them.
+
+    Args:
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection.
+
+    Returns:
+        bytes: The buffered data (plus anything readable right away), or b'' if there is none.
+    """
+    sock = imap.sock
+    timeout = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        # read1() returns the buffered bytes, or makes one non-blocking read if there are none
+        return imap.file.read1(65536) or b''
+    except (ssl.SSLWantReadError, BlockingIOError):
+        return b''
+    finally:
+        sock.settimeout(timeout)
+
+
+def idle_wait(imap, timeout, wakeup_sock=None):
+    """
+    Block in an IMAP IDLE session (RFC 2177) until the server pushes new mail.
+
+    The IDLE exchange is read straight from the socket so the wait can be interrupted
+    by the wakeup socket without polling.
+
+    Args:
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with a mailbox selected.
+        timeout (float): Maximum number of seconds to stay in IDLE.
+        wakeup_sock (socket.socket): Optional socket that ends the wait when it becomes readable.
+
+    Returns:
+        bool: True if the server reported new messages, False on timeout or wakeup.
+    """
+    sock = imap.sock
+    watched = [sock] if wakeup_sock is None else [sock, wakeup_sock]
+    deadline = time.monotonic() + timeout
+    # Start with whatever imaplib already buffered, e.g. an EXISTS sent after the last reply
+    pending = read_ahead(imap)
+    idling = done = completed = new_mail = False
+
+    imap.send(IDLE_TAG + b' IDLE\r\n')
+    while True:
+        # Handle every complete response line received so far
+        while b'\r\n' in pending:
+            line, pending = pending.split(b'\r\n', 1)
+            if line.startswith(IDLE_TAG + b' '):
+                # Tagged completion of the IDLE command
+                if not line.startswith(IDLE_TAG + b' OK'):
+                    raise imaplib.IMAP4.error(f"IDLE failed: {line.decode(errors='replace')}")
+                completed = True
+            elif line.startswith(b'+'):
+                idling = True
+            elif line.endswith((b' EXISTS', b' RECENT')):
+                new_mail = True
+        # Lines received after the tagged reply are still checked above; only return once
+        # no partial line is left that imaplib would otherwise choke on
+        if completed and not pending:
+            return new_mail
+
+        if idling and not done:
+            wake = new_mail
+            # Data already decrypted by the SSL layer will not show up in select()
+            if not wake and not sock.pending():
+                remaining = deadline - time.monotonic()
+                readable = []
+                if remaining > 0:
+                    readable, _, _ = select.select(watched, [], [], remaining)
+                if wakeup_sock is not None and wakeup_sock in readable:
+                    wakeup_sock.recv(64)
+                    wake = True
+                elif not readable:
+                    wake = True
+            if wake:
+                imap.send(b'DONE\r\n')
+                done = True
+                continue
+
+        data = sock.recv(4096)
+        if not data:
+            raise imaplib.IMAP4.abort("Connection closed by server during IDLE.")
+        pending += data
+
+
+def noop_wait(imap, timeout, stop_event):
+    """
+    Wait for new mail on servers without IDLE support by sending periodic NOOP keep-alives.
+
+    Args:
+        imap (imaplib.IMAP4_SSL): An authenticated IMAP connection with a mailbox selected.
+        timeout (float): Maximum number of seconds to wait.
+        stop_event (threading.Event): Event that ends the wait when set.
+
+    Returns:
+        bool: True if the server reported new messages, False on timeout or stop.
+    """
+    # Discard counts left over from SELECT so only new responses are reported
+    imap.response('EXISTS')
+    imap.response('RECENT')
+
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or stop_event.wait(min(NOOP_INTERVAL, remaining)):
+            return False
+        imap.noop()
+        exists = imap.response('EXISTS')[1][0]
+        recent = imap.response('RECENT')[1][0]
+        if exists is not None or recent is not None:
+            return True
+
+
+def reconnect_delay(failures, interval):
+    """
+    Compute how long to wait before reconnecting after failed connection attempts.
+
+    The delay doubles with every consecutive failure, starting at the check interval and
+    capped at RECONNECT_MAX_DELAY (or the check interval, if that is longer). Random
+    jitter keeps clients from retrying in lockstep when a server comes back.
+
+    Args:
+        failures (int): Number of consecutive failed attempts, at least 1.
+        interval (int): The check interval in seconds.
+
+    Returns:
+        float: The number of seconds to wait.
+    """
+    cap = max(interval, RECONNECT_MAX_DELAY)
+    return min(cap, interval * 2 ** min(failures - 1, 16) + random.uniform(0, interval))
+
+
+def parse_email_filter(filter_emails):
+    """
+    Split the comma-separated email filter into exact addresses and domains.
+
+    Args:
+        filter_emails (str): Comma-separated addresses and '@domain' entries.
+
+    Returns:
+        tuple: (frozenset of lower-cased addresses, frozenset of lower-cased domains without the '@').
+    """
+    entries = [entry.strip().lower() for entry in filter_emails.split(',') if entry.strip()]
+    return (
+        frozenset(entry for entry in entries if not entry.startswith('@')),
+        frozenset(entry[1:] for entry in entries if entry.startswith('@'))
+    )
+
+
+def matches_filter(sender_email, filter_exact, filter_domains):
+    """
+    Check a sender against the email filter.
+
+    Args:
+        sender_email (str): The lower-cased sender address.
+        filter_exact (frozenset): Addresses that are allowed.
+        filter_domains (frozenset): Domains that are allowed.
+
+    Returns:
+        bool: True if no filter is configured or the address or its domain is listed.
+    """
+    if not filter_exact and not filter_domains:
+        return True
+    if sender_email in filter_exact:
+        return True
+    _, at, domain = sender_email.rpartition('@')
+    return bool(at) and domain in filter_domains
+
+
+def mark_as_read(imap, email_ids):
+    """
+    Mark emails as read on the IMAP server using their UIDs, with a single STORE command.
 
     Args:
         imap (imaplib.IMAP4_SSL): An authenticated IMAP connection object.
-        email_id (bytes): The email ID to mark as read.
+        email_ids (list): The email UIDs (bytes) to mark as read.
 
     Returns:
         bool: True if successful, False otherwise.
     """
+    uid_set = b','.join(email_ids).decode()
     try:
-        imap.store(email_id, '+FLAGS', '\\Seen')
+        status, _ = imap.uid('STORE', uid_set, '+FLAGS', '(\\Seen)')
+        if status != "OK":
+            log.error("Failed to mark email(s) %s as read: %s", uid_set, status)
+            return False
         return True
     except Exception as e:
-        print(f"Failed to mark email as read: {e}")
+        log.error("Failed to mark email(s) %s as read: %s", uid_set, e)
         return False
 
 
 # Notification functions (implementations for each notification method)
 
+def get_twilio_client(account_sid, auth_token):
+    """
+    Return a cached Twilio client for the given credentials, creating it on first use.
+
+    Args:
+        account_sid (str): Twilio account SID.
+        auth_token (str): Twilio authentication token.
+
+    Returns:
+        Client: The Twilio REST client.
+    """
+    key = (account_sid, auth_token)
+    with _TWILIO_CLIENTS_LOCK:
+        client = _TWILIO_CLIENTS.get(key)
+        if client is None:
+            client = _TWILIO_CLIENTS[key] = Client(
+                account_sid, auth_token, http_client=TwilioHttpClient(timeout=HTTP_TIMEOUT[1]))
+        return client
+
+
+def get_slack_client(token):
+    """
+    Return a cached Slack client for the given token, creating it on first use.
+
+    Args:
+        token (str): Slack Bot User OAuth Token.
+
+    Returns:
+        WebClient: The Slack Web API client.
+    """
+    with _SLACK_CLIENTS_LOCK:
+        client = _SLACK_CLIENTS.get(token)
+        if client is None:
+            client = _SLACK_CLIENTS[token] = WebClient(token=token, timeout=HTTP_TIMEOUT[1])
+        return client
+
+
 def send_sms_via_twilio(account_sid, auth_token, from_number, to_number, body):
     """
     Send an SMS message using the Twilio API.
@@ -273,7 +1059,7 @@ def send_sms_via_twilio(account_sid, auth_token, from_number, to_number, body):
         str: Message SID if successful, None otherwise.
     """
     try:
-        client = Client(account_sid, auth_token)
+        client = get_twilio_client(account_sid, auth_token)
         message = client.messages.create(
             body=body,
             from_=from_number,
@@ -281,7 +1067,7 @@ def send_sms_via_twilio(account_sid, auth_token, from_number, to_number, body):
         )
         return message.sid
     except Exception as e:
-        print(f"Failed to send SMS to {to_number}: {e}")
+        log.error("Failed to send SMS to %s: %s", to_number, e)
         return None
 
 
@@ -300,15 +1086,18 @@ def make_voice_call(account_sid, auth_token, from_number, to_number, message):
         str: Call SID if successful, None otherwise.
     """
     try:
-        client = Client(account_sid, auth_token)
+        client = get_twilio_client(account_sid, auth_token)
+        # VoiceResponse escapes the message so characters such as < and & produce valid TwiML
+        response = VoiceResponse()
+        response.say(message)
         call = client.calls.create(
-            twiml=f'<Response><Say>{message}</Say></Response>',
+            twiml=str(response),
             from_=from_number,
             to=to_number
         )
         return call.sid
     except Exception as e:
-        print(f"Failed to make voice call to {to_number}: {e}")
+        log.error("Failed to make voice call to %s: %s", to_number, e)
         return None
 
 
@@ -327,7 +1116,7 @@ def send_whatsapp_message(account_sid, auth_token, from_number, to_number, body)
         str: Message SID if successful, None otherwise.
     """
     try:
-        client = Client(account_sid, auth_token)
+        client = get_twilio_client(account_sid, auth_token)
         message = client.messages.create(
             body=body,
             from_=from_number,
@@ -335,7 +1124,7 @@ def send_whatsapp_message(account_sid, auth_token, from_number, to_number, body)
         )
         return message.sid
     except Exception as e:
-        print(f"Failed to send WhatsApp message to {to_number}: {e}")
+        log.error("Failed to send WhatsApp message to %s: %s", to_number, e)
         return None
 
 
@@ -353,28 +1142,28 @@ def send_slack_message(token, channel, subject, body):
         str: Timestamp of the message if successful, None otherwise.
     """
     if not token or not channel:
-        print("Slack token or channel not configured properly")
+        log.error("Slack token or channel not configured properly")
         return None
 
     if not channel.startswith('#'):
         channel = f'#{channel}'
 
     try:
-        client = WebClient(token=token)
+        client = get_slack_client(token)
         # Format the subject in bold by wrapping it with asterisks
         formatted_body = f"*{subject}*\n{body}"
 
         response = client.chat_postMessage(
             channel=channel,
             text=formatted_body,
-            parse='full'  # Enable parsing of markup (e.g., bold, italics)
+            mrkdwn=True  # Format *bold* markup without full server-side re-parsing
         )
         return response["ts"]
     except SlackApiError as e:
-        print(f"Failed to send Slack message: {e}")
+        log.error("Failed to send Slack message: %s", e)
         return None
     except Exception as e:
-        print(f"Unexpected error sending Slack message: {e}")
+        log.error("Unexpected error sending Slack message: %s", e)
         return None
 
 
@@ -392,21 +1181,21 @@ def send_telegram_message(bot_token, chat_id, subject, body):
         bool: True if successful, False otherwise.
     """
     try:
-        message = f"*{subject}*\n{body}"
+        message = f"*{subject.translate(_TELEGRAM_ESCAPE)}*\n{body.translate(_TELEGRAM_ESCAPE)}"
         url = f'https://api.telegram.org/bot{bot_token}/sendMessage'
         params = {
             'chat_id': chat_id,
             'text': message,
-            'parse_mode': 'Markdown'
+            'parse_mode': 'MarkdownV2'
         }
-        response = requests.post(url, data=params)
+        response = _HTTP_SESSION.post(url, data=params, timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
             return True
         else:
-            print(f"Failed to send Telegram message: {response.status_code} {response.text}")
+            log.error("Failed to send Telegram message: %s %s", response.status_code, response.text)
             return False
     except Exception as e:
-        print(f"Failed to send Telegram message: {e}")
+        log.error("Failed to send Telegram message: %s", e)
         return False
 
 
@@ -423,17 +1212,20 @@ def send_discord_message(webhook_url, subject, body):
         bool: True if successful, False otherwise.
     """
     try:
-        data = {
-            "content": f"**{subject}**\n{body}"
-        }
-        response = requests.post(webhook_url, json=data)
+        content = f"**{subject.translate(_DISCORD_ESCAPE)}**\n{body.translate(_DISCORD_ESCAPE)}"
+        response = _HTTP_SESSION.post(
+            webhook_url,
+            data=_DISCORD_TEMPLATE % encode_json(content),
+            headers=_JSON_HEADERS,
+            timeout=HTTP_TIMEOUT
+        )
         if response.status_code in [200, 204]:
             return True
         else:
-            print(f"Failed to send Discord message: {response.status_code} {response.text}")
+            log.error("Failed to send Discord message: %s %s", response.status_code, response.text)
             return False
     except Exception as e:
-        print(f"Failed to send Discord message: {e}")
+        log.error("Failed to send Discord message: %s", e)
         return False
 
 
@@ -449,17 +1241,263 @@ def send_custom_webhook(webhook_url, payload):
         bool: True if successful, False otherwise.
     """
     try:
-        response = requests.post(webhook_url, json=payload)
+        response = _HTTP_SESSION.post(webhook_url, data=encode_json(payload), headers=_JSON_HEADERS, timeout=HTTP_TIMEOUT)
         if response.status_code in [200, 201, 202]:
             return True
         else:
-            print(f"Failed to send custom webhook: {response.status_code} {response.text}")
+            log.error("Failed to send custom webhook: %s %s", response.status_code, response.text)
             return False
     except Exception as e:
-        print(f"Failed to send custom webhook: {e}")
+        log.error("Failed to send custom webhook: %s", e)
         return False
 
 
+@dataclass(frozen=True, slots=True)
+class NotificationChannel:
+    """
+    One enabled notification destination, e.g. a single SMS recipient.
+
+    kwargs holds the sender arguments that do not depend on the email, read-only since
+    a channel is shared by all emails; content names the entry of notification_content()
+    that supplies the rest. {} in the success message is replaced with the sender's result.
+    """
+    func: object
+    kwargs: MappingProxyType
+    content: str
+    success_message: str
+    failure_message: str
+
+    def __post_init__(self):
+        # Frozen only stops rebinding kwargs, so take a read-only copy of the mapping
+        object.__setattr__(self, 'kwargs', MappingProxyType(dict(self.kwargs)))
+
+
+def notification_content(subject, body, max_sms_length):
+    """
+    Build the email-dependent sender arguments for each kind of notification content.
+
+    Args:
+        subject (str): The decoded email subject.
+        body (str): The email body.
+        max_sms_length (int): Maximum length of an SMS.
+
+    Returns:
+        dict: Sender keyword arguments keyed by NotificationChannel.content.
+    """
+    notification_message = f"{subject}: {body}"
+    return {
+        'sms': {'body': notification_message[:max_sms_length]},
+        'message': {'message': notification_message},
+        'text': {'body': notification_message},
+        'subject_body': {'subject': subject, 'body': body},
+        'payload': {'payload': {'subject': subject, 'body': body}},
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class MonitorSettings:
+    """
+    Immutable snapshot of the settings used by the monitoring loop.
+
+    Built from the GUI inputs when monitoring starts (and when settings are saved) so the
+    monitoring thread does not read the widgets and re-split their values on every cycle.
+    """
+    imap_server: str
+    imap_port: int
+    username: str
+    password: str
+    filter_exact: frozenset
+    filter_domains: frozenset
+    check_interval: int
+    max_sms_length: int
+    twilio_sms_enabled: bool
+    twilio_sms_account_sid: str
+    twilio_sms_auth_token: str
+    twilio_sms_from_number: str
+    twilio_sms_destination_numbers: tuple
+    voice_enabled: bool
+    voice_account_sid: str
+    voice_auth_token: str
+    voice_from_number: str
+    voice_destination_numbers: tuple
+    whatsapp_enabled: bool
+    whatsapp_account_sid: str
+    whatsapp_auth_token: str
+    whatsapp_from_number: str
+    whatsapp_to_numbers: tuple
+    slack_enabled: bool
+    slack_token: str
+    slack_channel: str
+    telegram_enabled: bool
+    telegram_bot_token: str
+    telegram_chat_id: str
+    discord_enabled: bool
+    discord_webhook_url: str
+    custom_webhook_enabled: bool
+    custom_webhook_url: str
+    # The enabled notification destinations, built once per snapshot in __post_init__
+    channels: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # The snapshot is frozen, so the derived field has to be set through object
+        object.__setattr__(self, 'channels', self._build_channels())
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a settings snapshot from configuration data.
+
+        Args:
+            config (configparser.ConfigParser): Configuration data loaded from config.ini.
+
+        Returns:
+            MonitorSettings: The settings snapshot.
+
+        Raises:
+            ValueError: If a numeric setting is not a valid integer.
+        """
+        email_section = config['Email']
+        settings_section = config['Settings']
+        filter_exact, filter_domains = parse_email_filter(email_section.get('filter_emails', ''))
+        return cls(
+            imap_server=email_section.get('imap_server'),
+            imap_port=int(email_section.get('imap_port')),
+            username=email_section.get('username'),
+            password=email_section.get('password'),
+            filter_exact=filter_exact,
+            filter_domains=filter_domains,
+            check_interval=int(settings_section.get('check_interval', '60')),
+            max_sms_length=int(settings_section.get('max_sms_length', '1600')),
+            twilio_sms_enabled=config.getboolean('Twilio', 'enabled', fallback=False),
+            twilio_sms_account_sid=config.get('Twilio', 'account_sid', fallback=''),
+            twilio_sms_auth_token=config.get('Twilio', 'auth_token', fallback=''),
+            twilio_sms_from_number=config.get('Twilio', 'from_number', fallback=''),
+            twilio_sms_destination_numbers=tuple(num.strip() for num in config.get('Twilio', 'destination_number', fallback='').split(',') if num.strip()),
+            voice_enabled=config.getboolean('Voice', 'enabled', fallback=False),
+            voice_account_sid=config.get('Voice', 'account_sid', fallback=''),
+            voice_auth_token=config.get('Voice', 'auth_token', fallback=''),
+            voice_from_number=config.get('Voice', 'from_number', fallback=''),
+            voice_destination_numbers=tuple(num.strip() for num in config.get('Voice', 'destination_number', fallback='').split(',') if num.strip()),
+            whatsapp_enabled=config.getboolean('WhatsApp', 'enabled', fallback=False),
+            whatsapp_account_sid=config.get('WhatsApp', 'account_sid', fallback=''),
+            whatsapp_auth_token=config.get('WhatsApp', 'auth_token', fallback=''),
+            whatsapp_from_number=config.get('WhatsApp', 'from_number', fallback=''),
+            whatsapp_to_numbers=tuple(num.strip() for num in config.get('WhatsApp', 'to_number', fallback='').split(',') if num.strip()),
+            slack_enabled=config.getboolean('Slack', 'enabled', fallback=False),
+            slack_token=config.get('Slack', 'token', fallback=''),
+            slack_channel=config.get('Slack', 'channel', fallback=''),
+            telegram_enabled=config.getboolean('Telegram', 'enabled', fallback=False),
+            telegram_bot_token=config.get('Telegram', 'bot_token', fallback=''),
+            telegram_chat_id=config.get('Telegram', 'chat_id', fallback=''),
+            discord_enabled=config.getboolean('Discord', 'enabled', fallback=False),
+            discord_webhook_url=config.get('Discord', 'webhook_url', fallback=''),
+            custom_webhook_enabled=config.getboolean('CustomWebhook', 'enabled', fallback=False),
+            custom_webhook_url=config.get('CustomWebhook', 'webhook_url', fallback='')
+        )
+
+    def matches_filter(self, sender_email):
+        """
+        Check a sender against the configured email filter.
+
+        Args:
+            sender_email (str): The lower-cased sender address.
+
+        Returns:
+            bool: True if no filter is configured or the address or its domain is listed.
+        """
+        return matches_filter(sender_email, self.filter_exact, self.filter_domains)
+
+    def _build_channels(self):
+        """
+        List the enabled notification destinations.
+
+        Called once per settings snapshot, so the monitoring loop only has to fill in
+        the email content for each destination.
+
+        Returns:
+            tuple: A NotificationChannel for every enabled method and recipient.
+        """
+        channels = []
+        if self.twilio_sms_enabled:
+            for to_number in self.twilio_sms_destination_numbers:
+                channels.append(NotificationChannel(send_sms_via_twilio, dict(
+                    account_sid=self.twilio_sms_account_sid,
+                    auth_token=self.twilio_sms_auth_token,
+                    from_number=self.twilio_sms_from_number,
+                    to_number=to_number
+                ), 'sms', f"Sent SMS to {to_number} with SID: {{}}", f"Failed to send SMS to {to_number}"))
+        if self.voice_enabled:
+            for to_number in self.voice_destination_numbers:
+                channels.append(NotificationChannel(make_voice_call, dict(
+                    account_sid=self.voice_account_sid,
+                    auth_token=self.voice_auth_token,
+                    from_number=self.voice_from_number,
+                    to_number=to_number
+                ), 'message', f"Initiated voice call to {to_number} with SID: {{}}", f"Failed to initiate voice call to {to_number}"))
+        if self.whatsapp_enabled:
+            for to_number in self.whatsapp_to_numbers:
+                channels.append(NotificationChannel(send_whatsapp_message, dict(
+                    account_sid=self.whatsapp_account_sid,
+                    auth_token=self.whatsapp_auth_token,
+                    from_number=self.whatsapp_from_number,
+                    to_number=to_number
+                ), 'text', f"Sent WhatsApp message to {to_number} with SID: {{}}", f"Failed to send WhatsApp message to {to_number}"))
+        if self.slack_enabled:
+            channels.append(NotificationChannel(send_slack_message, dict(
+                token=self.slack_token,
+                channel=self.slack_channel
+            ), 'subject_body', "Sent Slack message with timestamp: {}", "Failed to send Slack message"))
+        if self.telegram_enabled:
+            channels.append(NotificationChannel(send_telegram_message, dict(
+                bot_token=self.telegram_bot_token,
+                chat_id=self.telegram_chat_id
+            ), 'subject_body', "Sent Telegram message", "Failed to send Telegram message"))
+        if self.discord_enabled:
+            channels.append(NotificationChannel(send_discord_message, dict(
+                webhook_url=self.discord_webhook_url
+            ), 'subject_body', "Sent Discord message", "Failed to send Discord message"))
+        if self.custom_webhook_enabled:
+            channels.append(NotificationChannel(send_custom_webhook, dict(
+                webhook_url=self.custom_webhook_url
+            ), 'payload', "Sent custom webhook", "Failed to send custom webhook"))
+        return tuple(channels)
+
+    @property
+    def any_channel_enabled(self):
+        """
+        Whether at least one notification method is enabled with a destination to send to.
+        """
+        return bool(self.channels)
+
+
+class LogTabHandler(logging.Handler):
+    """
+    Logging handler that forwards records from the helper functions to the Logs tab.
+    """
+
+    def __init__(self, app):
+        """
+        Initialize the handler.
+
+        Args:
+            app (EmailMonitorApp): The application whose Logs tab receives the messages.
+        """
+        super().__init__(level=logging.INFO)
+        self.app = app
+
+    def emit(self, record):
+        """
+        Append the record's message to the Logs tab.
+
+        Args:
+            record (logging.LogRecord): The record to emit.
+        """
+        try:
+            self.app.log(record.getMessage())
+        except Exception:
+            self.handleError(record)
+
+
 class EmailMonitorApp:
     """
     The main application class for the Email Monitoring GUI.
@@ -481,6 +1519,28 @@ class EmailMonitorApp:
         self.root.title("Email to Notification Blaster")
         self.config = load_config()
         self.monitoring = False
+        self.stop_event = threading.Event()
+        self.monitor_thread = None
+        # Settings snapshot used by the monitoring thread, taken when monitoring starts
+        self.settings = None
+        # Thread pool that sends the notifications of each email in parallel
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=NOTIFICATION_WORKERS, thread_name_prefix='notify')
+        # Persistent IMAP connection and the login it was made with
+        self.imap = None
+        self._imap_login = None
+        # Socket pair used to interrupt a blocking IDLE wait when monitoring stops
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        # Digests of recently sent notifications mapped to when they were sent, oldest first
+        self._seen = collections.OrderedDict()
+        # Send times of the last minute's notifications per send function, for rate limiting
+        self._sent_times = collections.defaultdict(collections.deque)
+        # (time, message) pairs waiting to be written to the Logs tab
+        self._log_buffer = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_lock = threading.Lock()
+        # Show errors reported by the IMAP and notification helpers in the Logs tab too
+        log.addHandler(LogTabHandler(self))
 
         # Apply a modern theme
         style = ttk.Style()
@@ -499,6 +1559,12 @@ class EmailMonitorApp:
         # Create and layout all widgets
         self.create_widgets()
 
+        # Closing the window shuts down like File > Exit, so the IMAP session is logged out
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+
+        # Write buffered log messages to the Logs tab from the Tk event loop
+        self.poll_log()
+
     def create_menu(self):
         """
         Create the menu bar for the application.
@@ -511,7 +1577,7 @@ class EmailMonitorApp:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Save Settings", command=self.save_settings)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.exit_app)
 
         # Help menu
         help_menu = Menu(menubar, tearoff=False)
@@ -559,93 +1625,70 @@ class EmailMonitorApp:
         self.notebook.add(self.log_frame, text="Logs")
 
         # Email Configuration Tab
-        self.create_email_tab()
+        self.create_entry_tab('email_frame')
 
         # Settings Tab
-        self.create_settings_tab()
+        self.create_entry_tab('settings_frame')
 
         # Notification Methods Tab
         self.create_notification_methods_tab()
 
-        # Twilio SMS Configuration Tab
-        self.create_twilio_sms_tab()
-
-        # Twilio Voice Configuration Tab
-        self.create_twilio_voice_tab()
-
-        # Twilio WhatsApp Configuration Tab
-        self.create_twilio_whatsapp_tab()
-
-        # Slack Configuration Tab
-        self.create_slack_tab()
-
-        # Telegram Configuration Tab
-        self.create_telegram_tab()
-
-        # Discord Configuration Tab
-        self.create_discord_tab()
-
-        # Custom Webhook Configuration Tab
-        self.create_custom_webhook_tab()
-
-        # Logs Tab
-        self.create_logs_tab()
+        # The remaining tabs are only built when they are first shown; most sessions
+        # never open most of them
+        self._tab_builders = {
+            getattr(self, frame_name): functools.partial(self.create_entry_tab, frame_name)
+            for frame_name in ENTRY_TABS if frame_name not in ('email_frame', 'settings_frame')
+        }
+        self._tab_builders[self.log_frame] = self.create_logs_tab
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         # Control Buttons
         self.create_control_buttons()
 
-    def create_email_tab(self):
+    def on_tab_changed(self, event):
         """
-        Create widgets for the Email configuration tab.
-        """
-        frame = ttk.Frame(self.email_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="IMAP Server:").grid(column=0, row=0, sticky="W", pady=5)
-        self.imap_server_entry = ttk.Entry(frame, width=30)
-        self.imap_server_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.imap_server_entry.insert(0, self.config.get('Email', 'imap_server', fallback=''))
+        Build the contents of the selected tab the first time it is shown.
 
-        ttk.Label(frame, text="Port:").grid(column=0, row=1, sticky="W", pady=5)
-        self.imap_port_entry = ttk.Entry(frame, width=10)
-        self.imap_port_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.imap_port_entry.insert(0, self.config.get('Email', 'imap_port', fallback='993'))
-
-        ttk.Label(frame, text="Username:").grid(column=0, row=2, sticky="W", pady=5)
-        self.username_entry = ttk.Entry(frame, width=30)
-        self.username_entry.grid(column=1, row=2, pady=5, sticky="EW")
-        self.username_entry.insert(0, self.config.get('Email', 'username', fallback=''))
+        Args:
+            event (tk.Event): The <<NotebookTabChanged>> event.
+        """
+        frame = self.root.nametowidget(self.notebook.select())
+        builder = self._tab_builders.pop(frame, None)
+        if builder:
+            builder()
 
-        ttk.Label(frame, text="Password:").grid(column=0, row=3, sticky="W", pady=5)
-        self.password_entry = ttk.Entry(frame, width=30, show="*")
-        self.password_entry.grid(column=1, row=3, pady=5, sticky="EW")
-        self.password_entry.insert(0, self.config.get('Email', 'password', fallback=''))
+    def tab_built(self, frame):
+        """
+        Check whether the widgets of a lazily built tab exist yet.
 
-        # Email Filtering Field
-        ttk.Label(frame, text="Filter Emails (@domain or email):").grid(column=0, row=4, sticky="W", pady=5)
-        self.filter_emails_entry = ttk.Entry(frame, width=50)
-        self.filter_emails_entry.grid(column=1, row=4, pady=5, sticky="EW")
-        self.filter_emails_entry.insert(0, self.config.get('Email', 'filter_emails', fallback=''))
+        Args:
+            frame (ttk.Frame): The tab's frame.
 
-        ttk.Label(frame, text="(Separate multiple entries with commas)").grid(column=0, row=5, columnspan=2, pady=5, sticky="W")
+        Returns:
+            bool: True if the tab has been built.
+        """
+        return frame not in self._tab_builders
 
-    def create_settings_tab(self):
+    def create_entry_tab(self, frame_name):
         """
-        Create widgets for the Settings tab.
+        Create the labelled entry fields of a configuration tab from ENTRY_TABS.
+
+        Args:
+            frame_name (str): Attribute name of the tab's frame, e.g. 'email_frame'.
         """
-        frame = ttk.Frame(self.settings_frame, padding="10 10 10 10")
+        fields, hint = ENTRY_TABS[frame_name]
+        frame = ttk.Frame(getattr(self, frame_name), padding="10 10 10 10")
         frame.pack(fill="both", expand=True)
 
-        ttk.Label(frame, text="Max SMS Length:").grid(column=0, row=0, sticky="W", pady=5)
-        self.max_sms_length_entry = ttk.Entry(frame, width=10)
-        self.max_sms_length_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.max_sms_length_entry.insert(0, self.config.get('Settings', 'max_sms_length', fallback='1600'))
+        for row, (section, key, attribute, label, width, masked, default) in enumerate(fields):
+            ttk.Label(frame, text=label).grid(column=0, row=row, sticky="W", pady=5)
+            entry = ttk.Entry(frame, width=width, show="*" if masked else "")
+            entry.grid(column=1, row=row, pady=5, sticky="EW")
+            entry.insert(0, self.config.get(section, key, fallback=default))
+            setattr(self, attribute, entry)
 
-        # Check Interval Field
-        ttk.Label(frame, text="Check Interval (seconds):").grid(column=0, row=1, sticky="W", pady=5)
-        self.check_interval_entry = ttk.Entry(frame, width=10)
-        self.check_interval_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.check_interval_entry.insert(0, self.config.get('Settings', 'check_interval', fallback='60'))
+        if hint:
+            ttk.Label(frame, text=hint).grid(column=0, row=len(fields), columnspan=2, pady=5, sticky="W")
 
     def create_notification_methods_tab(self):
         """
@@ -672,151 +1715,6 @@ class EmailMonitorApp:
         ttk.Checkbutton(frame, text="Discord", variable=self.discord_var).grid(column=1, row=2, sticky="W", pady=5)
         ttk.Checkbutton(frame, text="Custom Webhook", variable=self.custom_webhook_var).grid(column=0, row=3, sticky="W", pady=5)
 
-    def create_twilio_sms_tab(self):
-        """
-        Create widgets for the Twilio SMS configuration tab.
-        """
-        frame = ttk.Frame(self.twilio_sms_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Account SID:").grid(column=0, row=0, sticky="W", pady=5)
-        self.twilio_sms_sid_entry = ttk.Entry(frame, width=30)
-        self.twilio_sms_sid_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.twilio_sms_sid_entry.insert(0, self.config.get('Twilio', 'account_sid', fallback=''))
-
-        ttk.Label(frame, text="Auth Token:").grid(column=0, row=1, sticky="W", pady=5)
-        self.twilio_sms_token_entry = ttk.Entry(frame, width=30, show="*")
-        self.twilio_sms_token_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.twilio_sms_token_entry.insert(0, self.config.get('Twilio', 'auth_token', fallback=''))
-
-        ttk.Label(frame, text="From Number:").grid(column=0, row=2, sticky="W", pady=5)
-        self.twilio_sms_from_entry = ttk.Entry(frame, width=30)
-        self.twilio_sms_from_entry.grid(column=1, row=2, pady=5, sticky="EW")
-        self.twilio_sms_from_entry.insert(0, self.config.get('Twilio', 'from_number', fallback=''))
-
-        ttk.Label(frame, text="Destination Number(s):").grid(column=0, row=3, sticky="W", pady=5)
-        self.twilio_sms_to_entry = ttk.Entry(frame, width=30)
-        self.twilio_sms_to_entry.grid(column=1, row=3, pady=5, sticky="EW")
-        dest_numbers = self.config.get('Twilio', 'destination_number', fallback='')
-        self.twilio_sms_to_entry.insert(0, dest_numbers)
-        ttk.Label(frame, text="(Separate multiple numbers with commas)").grid(column=0, row=4, columnspan=2, pady=5, sticky="W")
-
-    def create_twilio_voice_tab(self):
-        """
-        Create widgets for the Twilio Voice configuration tab.
-        """
-        frame = ttk.Frame(self.twilio_voice_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Account SID:").grid(column=0, row=0, sticky="W", pady=5)
-        self.twilio_voice_sid_entry = ttk.Entry(frame, width=30)
-        self.twilio_voice_sid_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.twilio_voice_sid_entry.insert(0, self.config.get('Voice', 'account_sid', fallback=''))
-
-        ttk.Label(frame, text="Auth Token:").grid(column=0, row=1, sticky="W", pady=5)
-        self.twilio_voice_token_entry = ttk.Entry(frame, width=30, show="*")
-        self.twilio_voice_token_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.twilio_voice_token_entry.insert(0, self.config.get('Voice', 'auth_token', fallback=''))
-
-        ttk.Label(frame, text="From Number:").grid(column=0, row=2, sticky="W", pady=5)
-        self.twilio_voice_from_entry = ttk.Entry(frame, width=30)
-        self.twilio_voice_from_entry.grid(column=1, row=2, pady=5, sticky="EW")
-        self.twilio_voice_from_entry.insert(0, self.config.get('Voice', 'from_number', fallback=''))
-
-        ttk.Label(frame, text="Destination Number(s):").grid(column=0, row=3, sticky="W", pady=5)
-        self.twilio_voice_to_entry = ttk.Entry(frame, width=30)
-        self.twilio_voice_to_entry.grid(column=1, row=3, pady=5, sticky="EW")
-        dest_numbers = self.config.get('Voice', 'destination_number', fallback='')
-        self.twilio_voice_to_entry.insert(0, dest_numbers)
-        ttk.Label(frame, text="(Separate multiple numbers with commas)").grid(column=0, row=4, columnspan=2, pady=5, sticky="W")
-
-    def create_twilio_whatsapp_tab(self):
-        """
-        Create widgets for the Twilio WhatsApp configuration tab.
-        """
-        frame = ttk.Frame(self.twilio_whatsapp_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Account SID:").grid(column=0, row=0, sticky="W", pady=5)
-        self.twilio_whatsapp_sid_entry = ttk.Entry(frame, width=30)
-        self.twilio_whatsapp_sid_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.twilio_whatsapp_sid_entry.insert(0, self.config.get('WhatsApp', 'account_sid', fallback=''))
-
-        ttk.Label(frame, text="Auth Token:").grid(column=0, row=1, sticky="W", pady=5)
-        self.twilio_whatsapp_token_entry = ttk.Entry(frame, width=30, show="*")
-        self.twilio_whatsapp_token_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.twilio_whatsapp_token_entry.insert(0, self.config.get('WhatsApp', 'auth_token', fallback=''))
-
-        ttk.Label(frame, text="From Number:").grid(column=0, row=2, sticky="W", pady=5)
-        self.twilio_whatsapp_from_entry = ttk.Entry(frame, width=30)
-        self.twilio_whatsapp_from_entry.grid(column=1, row=2, pady=5, sticky="EW")
-        self.twilio_whatsapp_from_entry.insert(0, self.config.get('WhatsApp', 'from_number', fallback=''))
-
-        ttk.Label(frame, text="To Number(s):").grid(column=0, row=3, sticky="W", pady=5)
-        self.twilio_whatsapp_to_entry = ttk.Entry(frame, width=30)
-        self.twilio_whatsapp_to_entry.grid(column=1, row=3, pady=5, sticky="EW")
-        dest_numbers = self.config.get('WhatsApp', 'to_number', fallback='')
-        self.twilio_whatsapp_to_entry.insert(0, dest_numbers)
-        ttk.Label(frame, text="(Separate multiple numbers with commas)").grid(column=0, row=4, columnspan=2, pady=5, sticky="W")
-
-    def create_slack_tab(self):
-        """
-        Create widgets for the Slack configuration tab.
-        """
-        frame = ttk.Frame(self.slack_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Slack Token:").grid(column=0, row=0, sticky="W", pady=5)
-        self.slack_token_entry = ttk.Entry(frame, width=50, show="*")
-        self.slack_token_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.slack_token_entry.insert(0, self.config.get('Slack', 'token', fallback=''))
-
-        ttk.Label(frame, text="Channel Name:").grid(column=0, row=1, sticky="W", pady=5)
-        self.slack_channel_entry = ttk.Entry(frame, width=30)
-        self.slack_channel_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.slack_channel_entry.insert(0, self.config.get('Slack', 'channel', fallback=''))
-
-    def create_telegram_tab(self):
-        """
-        Create widgets for the Telegram configuration tab.
-        """
-        frame = ttk.Frame(self.telegram_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Bot Token:").grid(column=0, row=0, sticky="W", pady=5)
-        self.telegram_bot_token_entry = ttk.Entry(frame, width=50, show="*")
-        self.telegram_bot_token_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.telegram_bot_token_entry.insert(0, self.config.get('Telegram', 'bot_token', fallback=''))
-
-        ttk.Label(frame, text="Chat ID:").grid(column=0, row=1, sticky="W", pady=5)
-        self.telegram_chat_id_entry = ttk.Entry(frame, width=30)
-        self.telegram_chat_id_entry.grid(column=1, row=1, pady=5, sticky="EW")
-        self.telegram_chat_id_entry.insert(0, self.config.get('Telegram', 'chat_id', fallback=''))
-
-    def create_discord_tab(self):
-        """
-        Create widgets for the Discord configuration tab.
-        """
-        frame = ttk.Frame(self.discord_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Webhook URL:").grid(column=0, row=0, sticky="W", pady=5)
-        self.discord_webhook_entry = ttk.Entry(frame, width=70)
-        self.discord_webhook_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.discord_webhook_entry.insert(0, self.config.get('Discord', 'webhook_url', fallback=''))
-
-    def create_custom_webhook_tab(self):
-        """
-        Create widgets for the Custom Webhook configuration tab.
-        """
-        frame = ttk.Frame(self.custom_webhook_frame, padding="10 10 10 10")
-        frame.pack(fill="both", expand=True)
-
-        ttk.Label(frame, text="Webhook URL:").grid(column=0, row=0, sticky="W", pady=5)
-        self.custom_webhook_entry = ttk.Entry(frame, width=70)
-        self.custom_webhook_entry.grid(column=1, row=0, pady=5, sticky="EW")
-        self.custom_webhook_entry.insert(0, self.config.get('CustomWebhook', 'webhook_url', fallback=''))
-
     def create_logs_tab(self):
         """
         Create widgets for the Logs tab.
@@ -827,6 +1725,9 @@ class EmailMonitorApp:
         self.log_text = scrolledtext.ScrolledText(frame, height=15, state='disabled')
         self.log_text.pack(fill="both", expand=True)
 
+        # Show what was logged before the tab was opened
+        self.flush_log()
+
     def create_control_buttons(self):
         """
         Create control buttons and place them at the bottom of the window.
@@ -843,51 +1744,34 @@ class EmailMonitorApp:
         self.save_button = ttk.Button(button_frame, text="Save Settings", command=self.save_settings)
         self.save_button.pack(side="left", padx=5)
 
+    def update_config_from_gui(self):
+        """
+        Copy the current values of the GUI inputs into the configuration object.
+
+        Tabs that were never opened keep the values already in the configuration.
+        """
+        for section, attribute in ENABLED_VARS:
+            self.config[section]['enabled'] = str(getattr(self, attribute).get())
+
+        for frame_name, (fields, _) in ENTRY_TABS.items():
+            if not self.tab_built(getattr(self, frame_name)):
+                continue
+            for section, key, attribute, *_ in fields:
+                self.config[section][key] = getattr(self, attribute).get()
+
     def save_settings(self):
         """
         Save the current settings from the GUI into the config.ini file.
         """
         # Update the configuration object with values from the GUI
-        self.config['Email']['imap_server'] = self.imap_server_entry.get()
-        self.config['Email']['imap_port'] = self.imap_port_entry.get()
-        self.config['Email']['username'] = self.username_entry.get()
-        self.config['Email']['password'] = self.password_entry.get()
-        self.config['Email']['filter_emails'] = self.filter_emails_entry.get()  # Save email filters
-
-        self.config['Settings']['max_sms_length'] = self.max_sms_length_entry.get()
-        self.config['Settings']['check_interval'] = self.check_interval_entry.get()  # Save check interval
-
-        self.config['Twilio']['enabled'] = str(self.twilio_sms_var.get())
-        self.config['Twilio']['account_sid'] = self.twilio_sms_sid_entry.get()
-        self.config['Twilio']['auth_token'] = self.twilio_sms_token_entry.get()
-        self.config['Twilio']['from_number'] = self.twilio_sms_from_entry.get()
-        self.config['Twilio']['destination_number'] = self.twilio_sms_to_entry.get()
-
-        self.config['Voice']['enabled'] = str(self.voice_var.get())
-        self.config['Voice']['account_sid'] = self.twilio_voice_sid_entry.get()
-        self.config['Voice']['auth_token'] = self.twilio_voice_token_entry.get()
-        self.config['Voice']['from_number'] = self.twilio_voice_from_entry.get()
-        self.config['Voice']['destination_number'] = self.twilio_voice_to_entry.get()
-
-        self.config['WhatsApp']['enabled'] = str(self.whatsapp_var.get())
-        self.config['WhatsApp']['account_sid'] = self.twilio_whatsapp_sid_entry.get()
-        self.config['WhatsApp']['auth_token'] = self.twilio_whatsapp_token_entry.get()
-        self.config['WhatsApp']['from_number'] = self.twilio_whatsapp_from_entry.get()
-        self.config['WhatsApp']['to_number'] = self.twilio_whatsapp_to_entry.get()
-
-        self.config['Slack']['enabled'] = str(self.slack_var.get())
-        self.config['Slack']['token'] = self.slack_token_entry.get()
-        self.config['Slack']['channel'] = self.slack_channel_entry.get()
-
-        self.config['Telegram']['enabled'] = str(self.telegram_var.get())
-        self.config['Telegram']['bot_token'] = self.telegram_bot_token_entry.get()
-        self.config['Telegram']['chat_id'] = self.telegram_chat_id_entry.get()
-
-        self.config['Discord']['enabled'] = str(self.discord_var.get())
-        self.config['Discord']['webhook_url'] = self.discord_webhook_entry.get()
-
-        self.config['CustomWebhook']['enabled'] = str(self.custom_webhook_var.get())
-        self.config['CustomWebhook']['webhook_url'] = self.custom_webhook_entry.get()
+        self.update_config_from_gui()
+
+        # Let a running monitor pick up the new settings on its next cycle
+        if self.monitoring:
+            try:
+                self.settings = MonitorSettings.from_config(self.config)
+            except ValueError:
+                self.log("Invalid numeric setting; monitoring continues with the previous settings.")
 
         # Save the updated configuration to the file
         save_config(self.config)
@@ -898,6 +1782,12 @@ class EmailMonitorApp:
         """
         Start the email monitoring process in a separate thread.
         """
+        # A stopped monitor thread may still be finishing a fetch or a notification; a
+        # second loop must not share its IMAP connection
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            messagebox.showwarning("Monitoring Stopping", "Monitoring is still stopping. Please try again in a moment.")
+            return
+
         # Validate that at least one notification method is selected
         if not any([
             self.twilio_sms_var.get(), self.voice_var.get(),
@@ -909,8 +1799,18 @@ class EmailMonitorApp:
             return
 
         # Validate required fields (e.g., Email credentials)
-        if not self.imap_server_entry.get() or not self.imap_port_entry.get() or not self.username_entry.get() or not self.password_entry.get():
-            messagebox.showwarning("Missing Credentials", "Please enter your email server settings and credentials.")
+        required = (
+            ("IMAP Server", self.imap_server_entry),
+            ("IMAP Port", self.imap_port_entry),
+            ("Username", self.username_entry),
+            ("Password", self.password_entry),
+        )
+        missing = [name for name, entry in required if not entry.get().strip()]
+        if missing:
+            messagebox.showwarning(
+                "Missing Credentials",
+                f"Please enter your email server settings and credentials. Missing: {', '.join(missing)}."
+            )
             return
 
         # Validate Check Interval
@@ -922,8 +1822,17 @@ class EmailMonitorApp:
             messagebox.showwarning("Invalid Check Interval", "Please enter a valid positive integer for the check interval.")
             return
 
+        # Snapshot the settings for the monitoring thread
+        self.update_config_from_gui()
+        try:
+            self.settings = MonitorSettings.from_config(self.config)
+        except ValueError:
+            messagebox.showwarning("Invalid Settings", "Please enter valid integers for the IMAP port and maximum SMS length.")
+            return
+
         # Disable the start button and enable the stop button
         self.monitoring = True
+        self.stop_event.clear()
         self.start_button.config(state="disabled")
         self.stop_button.config(state="normal")
         self.log("Monitoring started.")
@@ -938,21 +1847,174 @@ class EmailMonitorApp:
         Stop the email monitoring process.
         """
         self.monitoring = False
+        self.stop_event.set()
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         self.log("Monitoring stopped.")
 
+    def drain_wakeup(self):
+        """
+        Discard any pending bytes on the IDLE wakeup socket.
+        """
+        try:
+            while self._wakeup_r.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+
+    def exit_app(self):
+        """
+        Stop monitoring, log out from the IMAP server and close the application.
+        """
+        if self.monitoring:
+            self.stop_monitoring()
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            # Give the monitor thread a moment to log out
+            self.monitor_thread.join(5)
+        # Don't wait for notifications that are still in flight
+        self._executor.shutdown(wait=False)
+        self.root.quit()
+
+    def is_duplicate(self, digest):
+        """
+        Check whether a notification with this digest was sent recently, evicting expired entries.
+
+        Args:
+            digest (bytes): MD5 digest of the Message-ID, or of the sender, subject and start of the body.
+
+        Returns:
+            bool: True if the notification was already sent within SEEN_TTL seconds.
+        """
+        now = time.time()
+        while self._seen:
+            oldest, sent_at = next(iter(self._seen.items()))
+            if len(self._seen) <= SEEN_CAPACITY and now - sent_at < SEEN_TTL:
+                break
+            self._seen.popitem(last=False)
+        return digest in self._seen
+
+    def allow_notification(self, send_function):
+        """
+        Apply a sliding-window rate limit to a notification method.
+
+        Args:
+            send_function (callable): The send function of the notification method.
+
+        Returns:
+            bool: True if the notification may be sent now, in which case it is counted.
+        """
+        now = time.monotonic()
+        sent_times = self._sent_times[send_function]
+        while sent_times and now - sent_times[0] >= 60:
+            sent_times.popleft()
+        if len(sent_times) >= RATE_LIMIT_PER_MINUTE:
+            return False
+        sent_times.append(now)
+        return True
+
+    def ensure_connected(self, server, port, username, password):
+        """
+        Return the persistent IMAP connection, logging in and selecting the inbox if needed.
+
+        Args:
+            server (str): IMAP server address.
+            port (int): IMAP server port.
+            username (str): Email username.
+            password (str): Email password.
+
+        Returns:
+            imaplib.IMAP4_SSL: The connection, or None if connecting failed.
+        """
+        login = (server, port, username, password)
+        if self.imap is not None and login != self._imap_login:
+            self.log("IMAP settings changed. Reconnecting...")
+            self.disconnect_imap()
+
+        if self.imap is None:
+            imap = connect_to_imap(*login)
+            if not imap:
+                return None
+            self.imap = imap
+            self._imap_login = login
+            status, _ = imap.select("inbox")  # Select the inbox folder
+            if status != "OK":
+                self.log("Failed to select the inbox.")
+                self.disconnect_imap()
+                return None
+        return self.imap
+
+    def disconnect_imap(self, logout=True):
+        """
+        Close the persistent IMAP connection.
+
+        Args:
+            logout (bool): Send LOGOUT first; skip this for connections that were already dropped.
+        """
+        if not self.imap:
+            return
+        try:
+            if logout:
+                self.imap.logout()
+            else:
+                self.imap.shutdown()
+        except Exception as e:
+            self.log(f"Error while logging out from IMAP: {e}")
+        finally:
+            self.imap = None
+
     def log(self, message):
         """
         Append a message to the log text area.
 
+        Safe to call from the monitoring thread: messages are only buffered here, without
+        touching Tk, and poll_log() writes them to the widget in batches on the Tk event loop.
+
         Args:
             message (str): The message to log.
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        formatted_message = f"[{timestamp}] {message}\n"
+        # Only the time is captured here; formatting happens in batches in flush_log()
+        with self._log_lock:
+            self._log_buffer.append((time.time(), message))
+
+    def poll_log(self):
+        """
+        Flush the log buffer every LOG_FLUSH_INTERVAL milliseconds (Tk thread only).
+        """
+        self.flush_log()
+        self.root.after(LOG_FLUSH_INTERVAL, self.poll_log)
+
+    def flush_log(self):
+        """
+        Write the buffered log messages to the log text area in one insert (Tk thread only).
+
+        Messages logged before the Logs tab is first opened stay buffered until it is built.
+        """
+        if not self.tab_built(self.log_frame):
+            return
+        with self._log_lock:
+            entries = list(self._log_buffer)
+            self._log_buffer.clear()
+        if not entries:
+            return
+        lines = []
+        last_second = None
+        for logged_at, message in entries:
+            # Messages of a batch mostly share the same second, so format each second once
+            if int(logged_at) != last_second:
+                last_second = int(logged_at)
+                timestamp = datetime.fromtimestamp(last_second).strftime('%Y-%m-%d %H:%M:%S')
+            lines.append(f"[{timestamp}] {message}\n")
         self.log_text.configure(state='normal')
-        self.log_text.insert(tk.END, formatted_message)
+        self.log_text.insert(tk.END, ''.join(lines))
+        # Keep only the most recent lines so long sessions don't grow without bound;
+        # every message ends with a newline, so the last line of the widget is empty
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
         self.log_text.configure(state='disabled')
         self.log_text.see(tk.END)
 
@@ -960,244 +2022,132 @@ class EmailMonitorApp:
         """
         Monitor the inbox for unread emails and send notifications as configured.
         """
+        connect_failures = 0
         while self.monitoring:
-            imap = None
             try:
-                # Retrieve Email credentials and settings from GUI inputs
-                IMAP_SERVER = self.imap_server_entry.get()
-                IMAP_PORT = int(self.imap_port_entry.get())
-                EMAIL_USERNAME = self.username_entry.get()
-                EMAIL_PASSWORD = self.password_entry.get()
-                FILTER_EMAILS = [email.strip().lower() for email in self.filter_emails_entry.get().split(',') if email.strip()]
-
-                # Retrieve Check Interval
-                CHECK_INTERVAL = int(self.check_interval_entry.get())
-
-                # Retrieve Twilio SMS configuration
-                TWILIO_SMS_ENABLED = self.twilio_sms_var.get()
-                TWILIO_SMS_ACCOUNT_SID = self.twilio_sms_sid_entry.get()
-                TWILIO_SMS_AUTH_TOKEN = self.twilio_sms_token_entry.get()
-                TWILIO_SMS_FROM_NUMBER = self.twilio_sms_from_entry.get()
-                TWILIO_SMS_TO_NUMBERS = [num.strip() for num in self.twilio_sms_to_entry.get().split(',') if num.strip()]
-                MAX_SMS_LENGTH = int(self.max_sms_length_entry.get())
-
-                # Retrieve Twilio Voice configuration
-                VOICE_ENABLED = self.voice_var.get()
-                VOICE_ACCOUNT_SID = self.twilio_voice_sid_entry.get()
-                VOICE_AUTH_TOKEN = self.twilio_voice_token_entry.get()
-                VOICE_FROM_NUMBER = self.twilio_voice_from_entry.get()
-                VOICE_TO_NUMBERS = [num.strip() for num in self.twilio_voice_to_entry.get().split(',') if num.strip()]
-
-                # Retrieve Twilio WhatsApp configuration
-                WHATSAPP_ENABLED = self.whatsapp_var.get()
-                WHATSAPP_ACCOUNT_SID = self.twilio_whatsapp_sid_entry.get()
-                WHATSAPP_AUTH_TOKEN = self.twilio_whatsapp_token_entry.get()
-                WHATSAPP_FROM_NUMBER = self.twilio_whatsapp_from_entry.get()
-                WHATSAPP_TO_NUMBERS = [num.strip() for num in self.twilio_whatsapp_to_entry.get().split(',') if num.strip()]
-
-                # Retrieve Slack configuration
-                SLACK_ENABLED = self.slack_var.get()
-                SLACK_TOKEN = self.slack_token_entry.get()
-                SLACK_CHANNEL = self.slack_channel_entry.get()
-
-                # Retrieve Telegram configuration
-                TELEGRAM_ENABLED = self.telegram_var.get()
-                TELEGRAM_BOT_TOKEN = self.telegram_bot_token_entry.get()
-                TELEGRAM_CHAT_ID = self.telegram_chat_id_entry.get()
-
-                # Retrieve Discord configuration
-                DISCORD_ENABLED = self.discord_var.get()
-                DISCORD_WEBHOOK_URL = self.discord_webhook_entry.get()
-
-                # Retrieve Custom Webhook configuration
-                CUSTOM_WEBHOOK_ENABLED = self.custom_webhook_var.get()
-                CUSTOM_WEBHOOK_URL = self.custom_webhook_entry.get()
-
-                # Connect to the specified IMAP server
-                imap = connect_to_imap(IMAP_SERVER, IMAP_PORT, EMAIL_USERNAME, EMAIL_PASSWORD)
+                # Use the latest settings snapshot for this cycle
+                settings = self.settings
+
+                # There is no point in checking the inbox when no notification could be sent
+                if not settings.any_channel_enabled:
+                    self.log(f"No notification method is enabled. Checking again in {settings.check_interval} seconds...")
+                    self.stop_event.wait(settings.check_interval)
+                    continue
+
+                # Connect to the specified IMAP server, reusing the connection across iterations
+                imap = self.ensure_connected(settings.imap_server, settings.imap_port, settings.username, settings.password)
                 if not imap:
-                    self.log(f"Failed to connect to IMAP server {IMAP_SERVER}:{IMAP_PORT}. Retrying in {CHECK_INTERVAL} seconds...")
-                    time.sleep(CHECK_INTERVAL)
+                    # Back off while the server stays unreachable instead of retrying on a fixed interval
+                    connect_failures += 1
+                    delay = reconnect_delay(connect_failures, settings.check_interval)
+                    self.log(f"Failed to connect to IMAP server {settings.imap_server}:{settings.imap_port}. Retrying in {delay:.0f} seconds...")
+                    self.stop_event.wait(delay)
                     continue
+                connect_failures = 0
 
                 # Fetch unread emails from the inbox
                 unread_emails = fetch_unread_emails(imap)
                 self.log(f"Found {len(unread_emails)} unread emails.")
 
-                # Process each unread email individually
-                for email_id, msg in unread_emails:
-                    # Extract the sender's email address
-                    sender = msg.get("From")
-                    if sender:
-                        # Parse the sender's email address
-                        sender_email = email.utils.parseaddr(sender)[1].lower()
-                    else:
-                        sender_email = ""
+                # Process each unread email individually, collecting the UIDs to flag as read
+                successful_ids = []
+                for parsed in unread_emails:
+                    email_id, sender_email, subject, body = parsed.email_id, parsed.sender, parsed.subject, parsed.body
 
                     # Apply Email Filtering
-                    if FILTER_EMAILS:
-                        match = False
-                        for filter_entry in FILTER_EMAILS:
-                            if filter_entry.startswith('@'):
-                                # Domain filter
-                                domain = filter_entry[1:]
-                                if sender_email.endswith(f"@{domain}"):
-                                    match = True
-                                    break
-                            else:
-                                # Specific email address filter
-                                if sender_email == filter_entry:
-                                    match = True
-                                    break
-                        if not match:
-                            self.log(f"Email from {sender_email} does not match filter criteria. Skipping.")
-                            continue  # Skip to the next email
-
-                    # Extract the subject and body from the email
-                    # Decode the subject if necessary
-                    subject, encoding = decode_header(msg.get("Subject"))[0]
-                    if isinstance(subject, bytes):
-                        subject = subject.decode(encoding if encoding else "utf-8")
-
-                    # Extract the body of the email
-                    body = extract_email_body(msg)
+                    if not settings.matches_filter(sender_email):
+                        self.log(f"Email from {sender_email} does not match filter criteria. Skipping.")
+                        continue  # Skip to the next email
+
+                    # Skip emails whose notification was already sent, e.g. when marking
+                    # them as read failed the last time around; the Message-ID identifies
+                    # an email exactly, the content is the fallback for emails without one
+                    digest = hashlib.md5((parsed.message_id or f"{sender_email}|{subject}|{body[:512]}").encode()).digest()
+                    if self.is_duplicate(digest):
+                        self.log(f"Suppressed duplicate notification for email from {sender_email} with subject: {subject}")
+                        successful_ids.append(email_id)
+                        continue
+
                     self.log(f"Processing email from {sender_email} with subject: {subject}")
 
-                    # Flag to track if any notification was sent successfully
-                    success = False
+                    # Fill in the email content for every enabled notification destination
+                    content = notification_content(subject, body, settings.max_sms_length)
+                    tasks = [
+                        (channel.func, {**channel.kwargs, **content[channel.content]},
+                         channel.success_message, channel.failure_message)
+                        for channel in settings.channels
+                    ]
 
-                    # Construct the message for notifications
-                    notification_message = f"{subject}: {body}"
-
-                    # Send SMS via Twilio if enabled
-                    if TWILIO_SMS_ENABLED:
-                        sms_body = notification_message[:MAX_SMS_LENGTH] if len(notification_message) > MAX_SMS_LENGTH else notification_message
-                        for to_number in TWILIO_SMS_TO_NUMBERS:
-                            sms_sid = send_sms_via_twilio(
-                                account_sid=TWILIO_SMS_ACCOUNT_SID,
-                                auth_token=TWILIO_SMS_AUTH_TOKEN,
-                                from_number=TWILIO_SMS_FROM_NUMBER,
-                                to_number=to_number,
-                                body=sms_body
-                            )
-                            if sms_sid:
-                                self.log(f"Sent SMS to {to_number} with SID: {sms_sid}")
-                                success = True
-                            else:
-                                self.log(f"Failed to send SMS to {to_number}")
-
-                    # Make Voice Call via Twilio if enabled
-                    if VOICE_ENABLED:
-                        for to_number in VOICE_TO_NUMBERS:
-                            call_sid = make_voice_call(
-                                account_sid=VOICE_ACCOUNT_SID,
-                                auth_token=VOICE_AUTH_TOKEN,
-                                from_number=VOICE_FROM_NUMBER,
-                                to_number=to_number,
-                                message=notification_message
-                            )
-                            if call_sid:
-                                self.log(f"Initiated voice call to {to_number} with SID: {call_sid}")
-                                success = True
-                            else:
-                                self.log(f"Failed to initiate voice call to {to_number}")
-
-                    # Send WhatsApp message via Twilio if enabled
-                    if WHATSAPP_ENABLED:
-                        for to_number in WHATSAPP_TO_NUMBERS:
-                            message_sid = send_whatsapp_message(
-                                account_sid=WHATSAPP_ACCOUNT_SID,
-                                auth_token=WHATSAPP_AUTH_TOKEN,
-                                from_number=WHATSAPP_FROM_NUMBER,
-                                to_number=to_number,
-                                body=notification_message
-                            )
-                            if message_sid:
-                                self.log(f"Sent WhatsApp message to {to_number} with SID: {message_sid}")
+                    # The notifications are independent network calls, so send them concurrently
+                    # and track if any notification was sent successfully
+                    success = False
+                    futures = {}
+                    for func, kwargs, success_message, failure_message in tasks:
+                        if not self.allow_notification(func):
+                            self.log(f"{failure_message}: rate limit of {RATE_LIMIT_PER_MINUTE} per minute reached")
+                            continue
+                        futures[self._executor.submit(func, **kwargs)] = (success_message, failure_message)
+                    try:
+                        for future in concurrent.futures.as_completed(futures, timeout=NOTIFICATION_TIMEOUT):
+                            success_message, failure_message = futures[future]
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                # One failing sender must not abort the others or the cycle
+                                self.log(f"{failure_message}: {e}")
+                                continue
+                            if result:
+                                self.log(success_message.format(result))
                                 success = True
                             else:
-                                self.log(f"Failed to send WhatsApp message to {to_number}")
-
-                    # Send Slack message if enabled
-                    if SLACK_ENABLED:
-                        slack_ts = send_slack_message(
-                            token=SLACK_TOKEN,
-                            channel=SLACK_CHANNEL,
-                            subject=subject,
-                            body=body
-                        )
-                        if slack_ts:
-                            self.log(f"Sent Slack message with timestamp: {slack_ts}")
-                            success = True
-                        else:
-                            self.log("Failed to send Slack message")
-
-                    # Send Telegram message if enabled
-                    if TELEGRAM_ENABLED:
-                        telegram_success = send_telegram_message(
-                            bot_token=TELEGRAM_BOT_TOKEN,
-                            chat_id=TELEGRAM_CHAT_ID,
-                            subject=subject,
-                            body=body
-                        )
-                        if telegram_success:
-                            self.log("Sent Telegram message")
-                            success = True
-                        else:
-                            self.log("Failed to send Telegram message")
-
-                    # Send Discord message if enabled
-                    if DISCORD_ENABLED:
-                        discord_success = send_discord_message(
-                            webhook_url=DISCORD_WEBHOOK_URL,
-                            subject=subject,
-                            body=body
-                        )
-                        if discord_success:
-                            self.log("Sent Discord message")
-                            success = True
-                        else:
-                            self.log("Failed to send Discord message")
-
-                    # Send Custom Webhook if enabled
-                    if CUSTOM_WEBHOOK_ENABLED:
-                        payload = {
-                            'subject': subject,
-                            'body': body
-                        }
-                        custom_webhook_success = send_custom_webhook(
-                            webhook_url=CUSTOM_WEBHOOK_URL,
-                            payload=payload
-                        )
-                        if custom_webhook_success:
-                            self.log("Sent custom webhook")
-                            success = True
-                        else:
-                            self.log("Failed to send custom webhook")
+                                self.log(failure_message)
+                    except concurrent.futures.TimeoutError:
+                        self.log(f"Some notifications for email {email_id.decode()} did not finish within {NOTIFICATION_TIMEOUT} seconds.")
 
                     # Mark the email as read if any notification was sent successfully
                     if success:
-                        if mark_as_read(imap, email_id):
-                            self.log(f"Marked email {email_id.decode()} as read")
-                        else:
-                            self.log(f"Failed to mark email {email_id.decode()} as read")
+                        self._seen[digest] = time.time()
+                        successful_ids.append(email_id)
                     else:
                         self.log(f"No successful notifications sent for email {email_id.decode()}")
 
+                # Flag all notified emails in one round-trip
+                if successful_ids:
+                    uid_list = ', '.join(email_id.decode() for email_id in successful_ids)
+                    if mark_as_read(imap, successful_ids):
+                        self.log(f"Marked email(s) {uid_list} as read")
+                    else:
+                        self.log(f"Failed to mark email(s) {uid_list} as read")
+
+                # Wait for the server to push new mail instead of polling on a fixed interval;
+                # the check interval still bounds the wait so unsent emails are retried
+                # Discard wakeups left over from an earlier stop before checking for a new one;
+                # stop_monitoring() sets the flag before it writes to the socket
+                self.drain_wakeup()
+                if self.monitoring:
+                    if 'IDLE' in imap.capabilities:
+                        self.log("Waiting for new emails (IMAP IDLE).")
+                        idle_wait(imap, min(IDLE_TIMEOUT, settings.check_interval), self._wakeup_r)
+                    else:
+                        noop_wait(imap, settings.check_interval, self.stop_event)
+
+            except (imaplib.IMAP4.abort, OSError) as e:
+                # Only a dropped connection requires a new login
+                self.log(f"IMAP connection lost: {e}. Reconnecting...")
+                self.disconnect_imap(logout=False)
             except Exception as e:
                 self.log(f"An error occurred: {e}")
-            finally:
-                # Ensure the IMAP connection is properly closed
-                if imap:
-                    try:
-                        imap.logout()
-                    except Exception as e:
-                        self.log(f"Error while logging out from IMAP: {e}")
                 # Wait before checking for new emails again based on check interval
-                time.sleep(CHECK_INTERVAL)
+                self.stop_event.wait(settings.check_interval)
+
+        # Ensure the IMAP connection is properly closed once monitoring stops
+        self.disconnect_imap()
 
 
 if __name__ == '__main__':
+    # Report helper errors on the console as well as in the Logs tab
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
     # Initialize the main Tkinter window
     root = tk.Tk()
     app = EmailMonitorApp(root)